@@ -0,0 +1,149 @@
+"""
+Microbenchmark of filtering resources by their tags in memory.
+
+Compares scanning the tag list of each resource for every filter, as Filter.match did before filters were compiled,
+with compiling the filters once and applying the predicates to a tag dictionary built once per resource, as resources
+are filtered when they are listed. Every filter matches every resource, so all filters are evaluated in full.
+
+Run from the repository root:
+
+    python -m benchmarks.filter_benchmark --resources 20000 --tags 50 --filters 10
+"""
+import argparse
+import timeit
+from typing import List
+
+from src.model.filter import Filter
+from src.model.tag import Tag
+
+OPERATORS = ['=', '!=', '~', '!~', '^', '!^', '$', '!$']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark filtering resources by their tags.')
+    parser.add_argument('--resources', type=int, default=20000, help='Number of resources.')
+    parser.add_argument('--tags', type=int, default=50, help='Number of tags of each resource.')
+    parser.add_argument('--filters', type=int, default=10, help='Number of filters, at most the number of tags.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs, of which the fastest is reported.')
+    args = parser.parse_args()
+
+    if not 0 < args.filters <= args.tags:
+        parser.error('The number of filters must be between 1 and the number of tags.')
+
+    resources_tags = [__get_tags(args.tags) for _ in range(args.resources)]
+    filters = __get_filters(args.tags, args.filters)
+
+    assert __scan(resources_tags, filters) == __compiled(resources_tags, filters) == args.resources
+
+    scan_time = min(timeit.repeat(lambda: __scan(resources_tags, filters), number=1, repeat=args.repeat))
+    compiled_time = min(timeit.repeat(lambda: __compiled(resources_tags, filters), number=1, repeat=args.repeat))
+
+    print(f"{args.resources} resources, {args.tags} tags each, {args.filters} filters, best of {args.repeat} runs")
+    print(f"Scan tag list per filter:    {scan_time:.3f}s")
+    print(f"Compiled filters, tag dict:  {compiled_time:.3f}s")
+    print(f"Speedup:                     {scan_time / compiled_time:.2f}x")
+
+
+def __get_tags(tag_count: int) -> List[Tag]:
+    """
+    Get the tags of a resource.
+
+    :param tag_count: Number of tags.
+    :return: Tag list.
+    """
+    return [Tag(key=f'key-{tag_index}', value=f'value-{tag_index}') for tag_index in range(tag_count)]
+
+
+def __get_filters(tag_count: int, filter_count: int) -> List[Filter]:
+    """
+    Get filters on the last tags of the resources, which every resource matches, so a scan has to walk the tag list.
+
+    :param tag_count: Number of tags of each resource.
+    :param filter_count: Number of filters.
+    :return: Filter list.
+    """
+    filters = []
+
+    for filter_index in range(filter_count):
+        tag_index = tag_count - 1 - filter_index
+        operator = OPERATORS[filter_index % len(OPERATORS)]
+        value = {
+            '=': f'value-{tag_index}',
+            '~': 'value',
+            '^': 'value-',
+            '$': f'-{tag_index}',
+        }.get(operator, 'other')
+        filters.append(Filter(key=f'key-{tag_index}', value=value, operator=operator))
+
+    return filters
+
+
+def __scan(resources_tags: List[List[Tag]], filters: List[Filter]) -> int:
+    """
+    Count the matching resources, scanning the tag list of each resource for every filter.
+
+    :param resources_tags: Tag lists of the resources.
+    :param filters: Filters.
+    :return: Number of resources that match all filters.
+    """
+    return sum(1 for tags in resources_tags if all(__scan_match(filter, tags) for filter in filters))
+
+
+def __scan_match(filter: Filter, tags: List[Tag]) -> bool:
+    """
+    Check if the filter matches the given tags, as Filter.match did before filters were compiled.
+
+    :param filter: Filter.
+    :param tags: Tag list.
+    :return: True, if the filter matches the given tags.
+    """
+    if filter.operator == "--":
+        tag_keys = [tag.key for tag in tags]
+        return filter.key not in tag_keys
+
+    for tag in tags:
+        if filter.key == tag.key:
+            if filter.operator == "=":
+                return tag.value == filter.value
+            elif filter.operator == "!=":
+                return tag.value != filter.value
+            elif filter.operator == "~":
+                return filter.value in tag.value
+            elif filter.operator == "!~":
+                return filter.value not in tag.value
+            elif filter.operator == "^":
+                return tag.value.startswith(filter.value)
+            elif filter.operator == "!^":
+                return not tag.value.startswith(filter.value)
+            elif filter.operator == "$":
+                return tag.value.endswith(filter.value)
+            elif filter.operator == "!$":
+                return not tag.value.endswith(filter.value)
+            else:
+                raise ValueError(f"Unknown operator: {filter.operator}")
+
+    return False
+
+
+def __compiled(resources_tags: List[List[Tag]], filters: List[Filter]) -> int:
+    """
+    Count the matching resources, compiling the filters once and building the tag dictionary once per resource.
+
+    :param resources_tags: Tag lists of the resources.
+    :param filters: Filters.
+    :return: Number of resources that match all filters.
+    """
+    predicates = [filter.compile() for filter in filters]
+    count = 0
+
+    for tags in resources_tags:
+        tags_dict = {tag.key: tag.value for tag in reversed(tags)}
+
+        if all(predicate(tags_dict) for predicate in predicates):
+            count += 1
+
+    return count
+
+
+if __name__ == '__main__':
+    main()
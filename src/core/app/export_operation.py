@@ -1,31 +1,28 @@
-from typing import List
+from typing import List, Dict, Optional
 
 import pandas as pd
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import file_helper, input_helper
+from src.helper import file_helper, input_helper, concurrency_helper, service_helper
 from src.model.filter import Filter
+from src.model.resource import Resource
 
 
-def export_tags(service: BaseAwsService, filters: List[Filter], file_path: str, export_tags: List[str]) -> None:
+def export_tags(services: List[BaseAwsService], filters: List[Filter], file_path: str, export_tags: List[str],
+                fan_out: int) -> None:
     """
     Export the resource tags.
 
-    :param service: Service to export resource tags for.
+    :param services: Services to export resource tags for, one per service, account and region.
     :param filters: Filters to apply to find resources to be exported.
     :param file_path: File path to export resource tags to.
     :param export_tags: List of tags to export. If empty, export all tags.
+    :param fan_out: Maximum number of services to list and export at the same time.
     """
     if not file_path:
         print("No file path was provided. Please use --file option.")
         return
 
-    resources = service.list_resources(filters)
-
-    if not resources:
-        print(f"No resources were found for {service.nice_name}.")
-        return
-
     if export_tags:
         print("The following tags will be exported.")
 
@@ -34,32 +31,31 @@ def export_tags(service: BaseAwsService, filters: List[Filter], file_path: str,
 
         print('\n')
 
-    print(f"The following {service.nice_name} resources will be exported.")
+    nice_names = service_helper.get_nice_names(services)
+    print(f"The following {nice_names} resources will be exported.")
 
-    for resource in resources:
-        text = f"{resource.name} ({resource.description})" if resource.description else resource.name
-        print(f"- {text}")
+    service_resources = {service: [] for service in services}
+
+    for service, resource in service_helper.list_resources(services, filters, fan_out):
+        print(f"- {service_helper.get_resource_text(service, resource, services)}")
+        service_resources[service].append(resource)
+
+    if not any(service_resources.values()):
+        print(f"No resources were found for {nice_names}.")
+        return
 
     print('\n')
     answer = input_helper.get_user_input()
 
     if answer == 'y':
-        resource_tags = []
-
-        for resource in resources:
-            try:
-                tags = service.get_resource_tags(resource)
-                tags_dict = {
-                    tag.key: tag.value
-                    for tag in tags
-                    if not export_tags or tag.key in export_tags or tag.key in ['@name', '@service']
-                }
-                resource_tags.append(tags_dict)
-            except Exception as exception:
-                print(f"Error while getting tags for resource {resource.name}: {exception}")
+        service_resource_tags = concurrency_helper.ordered_map(
+            lambda item: __get_service_export_tags_dicts(item[0], item[1], export_tags),
+            [(service, resources) for service, resources in service_resources.items() if resources],
+            fan_out
+        )
+        resource_tags = [tags_dict for resource_tags in service_resource_tags for tags_dict in resource_tags]
 
         df = pd.DataFrame(resource_tags)
-        df = __add_service_column(df, service)
         df = __add_export_tags_columns(df, export_tags)
         df = __order_df_columns(df)
         df = __sort_df(df)
@@ -70,17 +66,63 @@ def export_tags(service: BaseAwsService, filters: List[Filter], file_path: str,
         print("\nExporting cancelled.")
 
 
-def __add_service_column(df: pd.DataFrame, service: BaseAwsService) -> pd.DataFrame:
+def __get_service_export_tags_dicts(service: BaseAwsService, resources: List[Resource],
+                                    export_tags: List[str]) -> List[Dict[str, str]]:
     """
-    Add a column to the given DataFrame with the service short name.
+    Get the tags of the given resources of a service to be exported as dictionaries, with the service columns added.
 
-    :param df: DataFrame to add column to.
-    :param service: Service to add column for.
-    :return: DataFrame with added column.
+    :param service: Service of the resources.
+    :param resources: Resources to get tags for.
+    :param export_tags: List of tags to export. If empty, export all tags.
+    :return: List of dictionaries of tag keys to values, without the resources whose tags could not be fetched.
     """
-    df['@service'] = service.short_name
+    resource_tags = concurrency_helper.ordered_map(
+        lambda resource: __get_export_tags_dict(service, resource, export_tags),
+        resources,
+        service.options.concurrency
+    )
+    resource_tags = [__add_service_columns(tags_dict, service) for tags_dict in resource_tags if tags_dict is not None]
 
-    return df
+    return resource_tags
+
+
+def __get_export_tags_dict(service: BaseAwsService, resource: Resource,
+                           export_tags: List[str]) -> Optional[Dict[str, str]]:
+    """
+    Get the tags of the given resource to be exported as a dictionary.
+
+    :param service: Service of the resource.
+    :param resource: Resource to get tags for.
+    :param export_tags: List of tags to export. If empty, export all tags.
+    :return: Dictionary of tag keys to values, or None if the tags could not be fetched.
+    """
+    try:
+        tags = service.get_resource_tags(resource)
+        tags_dict = {
+            tag.key: tag.value
+            for tag in tags
+            if not export_tags or tag.key in export_tags or tag.key in ['@name', '@service']
+        }
+
+        return tags_dict
+    except Exception as exception:
+        print(f"Error while getting tags for resource {resource.name}: {exception}")
+        return None
+
+
+def __add_service_columns(tags_dict: Dict[str, str], service: BaseAwsService) -> Dict[str, str]:
+    """
+    Add the service short name, account ID and region to the given tags dictionary.
+
+    :param tags_dict: Dictionary of tag keys to values.
+    :param service: Service to add columns for.
+    :return: Dictionary with added columns.
+    """
+    tags_dict['@service'] = service.short_name
+    tags_dict['@account'] = service.caller_context.account_id
+    tags_dict['@region'] = service.region
+
+    return tags_dict
 
 
 def __add_export_tags_columns(df: pd.DataFrame, export_tags: List[str]) -> pd.DataFrame:
@@ -100,17 +142,22 @@ def __add_export_tags_columns(df: pd.DataFrame, export_tags: List[str]) -> pd.Da
 
 def __order_df_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Order the columns of the given DataFrame to get '@name' column as the first column.
+    Order the columns of the given DataFrame to get '@service', '@account', '@region' and '@name' columns as the first
+    columns.
 
     :param df: DataFrame to order columns of.
     :return: DataFrame with ordered columns.
     """
     cols = df.columns.values.tolist()
     cols.remove('@service')
+    cols.remove('@account')
+    cols.remove('@region')
     cols.remove('@name')
     cols.sort()
     cols.insert(0, '@service')
-    cols.insert(1, '@name')
+    cols.insert(1, '@account')
+    cols.insert(2, '@region')
+    cols.insert(3, '@name')
     df = df[cols]
 
     return df
@@ -118,11 +165,11 @@ def __order_df_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 def __sort_df(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Sort the given DataFrame by the '@name' column.
+    Sort the given DataFrame by the '@service', '@account', '@region' and '@name' columns.
 
     :param df: DataFrame to sort.
     :return: Sorted DataFrame.
     """
-    df = df.sort_values(by=['@name'])
+    df = df.sort_values(by=['@service', '@account', '@region', '@name'])
 
     return df
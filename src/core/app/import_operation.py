@@ -1,21 +1,26 @@
 from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 
 import pandas as pd
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import file_helper, input_helper
+from src.core.journal.tag_journal import TagJournal
+from src.core.progress.progress_reporter import ProgressReporter
+from src.helper import file_helper, input_helper, session_helper, caller_context_helper
 from src.factory.service_factory import ServiceFactory
 from src.model.resource_tags import ResourceTags
 from src.model.tag import Tag
 
 
-def import_tags(file_path: str) -> None:
+def import_tags(file_path: str, accounts: List[Optional[str]], journal_path: str = '') -> None:
     """
     Import the resource tags.
+    The resources to be tagged and the ones that are done are recorded in a journal, to resume an interrupted run.
 
-    :param service: Service to import resource tags for.
     :param file_path: File path to import resource tags from.
+    :param accounts: Accounts to import resource tags to, as profile names, ARNs of the roles to assume, or None for the
+                     default credentials. The '@account' column of the file is matched to the IDs of these accounts.
+    :param journal_path: Path of the journal file, or empty for a new file in the default directory.
     """
     if not file_path:
         print("No file path was provided. Please use --file option.")
@@ -24,49 +29,77 @@ def import_tags(file_path: str) -> None:
     file_helper.validate_file_exists(file_path)
 
     df = file_helper.read_csv_to_df(file_path)
-    service_resource_tags = __df_to_resource_tags(df)
+    service_resource_tags = __df_to_resource_tags(df, accounts)
 
     print(f"The following services are found.")
 
     for service in service_resource_tags:
-        print(f'- {service.nice_name}')
+        print(f'- {service.nice_name} ({service.scope})')
 
-    for service in service_resource_tags:
-        print(f"\nThe following {service.nice_name} resources will be tagged.\n")
-        resource_tags_list = service_resource_tags[service]
-
-        for resource_tags in resource_tags_list:
-            print(str(resource_tags) + '\n\n')
+    journal = None
 
-        answer = input_helper.get_user_input()
+    try:
+        for service in service_resource_tags:
+            print(f"\nThe following {service.nice_name} resources in {service.scope} will be tagged.\n")
+            resource_tags_list = service_resource_tags[service]
 
-        if answer == 'y':
             for resource_tags in resource_tags_list:
-                service.tag_resource(resource_tags.resource, resource_tags.tags)
+                print(str(resource_tags) + '\n\n')
+
+            answer = input_helper.get_user_input()
+
+            if answer == 'y':
+                if journal is None:
+                    journal = TagJournal.create('import', journal_path)
+                    print(f"\nRecording the progress in {journal.path}. Use --resume {journal.path} to resume if "
+                          f"interrupted.\n")
+
+                journal.add_planned(service.key, resource_tags_list)
+                journal.sync()
+                progress = ProgressReporter(len(resource_tags_list))
+                failed_count = len(service.apply_tags(resource_tags_list, progress, journal))
+                progress.finish()
 
-            print(f"\nCompleted tagging {len(resource_tags_list)} resources.")
-        else:
-            print("\nTagging cancelled.")
+                print(f"\nCompleted tagging {progress.succeeded} resources.")
 
+                if progress.skipped:
+                    print(f"Skipped {progress.skipped} resources that already have the tags.")
 
-def __df_to_resource_tags(df: pd.DataFrame) -> Dict[BaseAwsService, List[ResourceTags]]:
+                if failed_count:
+                    print(f"Failed to tag {failed_count} resources.")
+            else:
+                print("\nTagging cancelled.")
+    finally:
+        if journal is not None:
+            journal.close()
+
+
+def __df_to_resource_tags(df: pd.DataFrame, accounts: List[Optional[str]]) -> Dict[BaseAwsService, List[ResourceTags]]:
     """
     Convert the given DataFrame to a list of resource tags per service.
+    Files without the '@account' and '@region' columns, or rows with an empty account or region, are imported to the
+    first given account and the default region.
 
     :param df: DataFrame of tags.
+    :param accounts: Accounts to import resource tags to.
     :return: List of resource tags per service.
     """
     resource_names = df['@name'].values.tolist()
     service_names = df['@service'].values.tolist()
+    account_ids = df['@account'].fillna('').values.tolist() if '@account' in df.columns else [''] * len(df)
+    region_names = df['@region'].fillna('').values.tolist() if '@region' in df.columns else [''] * len(df)
 
-    tags_df = df.drop(columns=['@service', '@name']).fillna('')
+    special_cols = ['@service', '@account', '@region', '@name']
+    tags_df = df.drop(columns=[col for col in special_cols if col in df.columns]).fillna('')
 
     cols = tags_df.columns.values.tolist()
     rows = tags_df.values.tolist()
 
-    service_resource_tags = defaultdict(list)
+    accounts_by_id = __get_accounts_by_id(accounts, set(account_ids) - {''})
+    service_name_tags = defaultdict(list)
 
-    for service_name, resource_name, row in zip(service_names, resource_names, rows):
+    for service_name, account_id, region_name, resource_name, row in zip(
+            service_names, account_ids, region_names, resource_names, rows):
         tags = []
 
         for tag_value, tag_key in zip(row, cols):
@@ -75,9 +108,38 @@ def __df_to_resource_tags(df: pd.DataFrame) -> Dict[BaseAwsService, List[Resourc
                 tag = Tag(str(tag_key), str(tag_value))
                 tags.append(tag)
 
-        service = ServiceFactory().get_service(service_name)
-        resource = service.get_resource(resource_name)
-        resource_tags = ResourceTags(resource, tags)
-        service_resource_tags[service].append(resource_tags)
+        account = accounts_by_id[account_id] if account_id else accounts[0]
+        service_name_tags[(service_name, region_name or None, account)].append((resource_name, tags))
+
+    service_resource_tags = {}
+
+    for (service_name, region_name, account), name_tags in service_name_tags.items():
+        service = ServiceFactory().get_service(service_name, region_name, account)
+        resources = service.get_resources([resource_name for resource_name, _ in name_tags])
+        service_resource_tags[service] = [
+            ResourceTags(resource, tags) for resource, (_, tags) in zip(resources, name_tags)
+        ]
 
     return service_resource_tags
+
+
+def __get_accounts_by_id(accounts: List[Optional[str]], account_ids: Set[str]) -> Dict[str, Optional[str]]:
+    """
+    Match the given account IDs to the given accounts, by resolving the account ID of each account.
+
+    :param accounts: Accounts to import resource tags to.
+    :param account_ids: Account IDs found in the file.
+    :return: Dictionary of account ID to account.
+    """
+    if not account_ids:
+        return {}
+
+    accounts_by_id = {
+        caller_context_helper.get_account_id(session_helper.get_session(account)): account for account in accounts
+    }
+
+    for account_id in account_ids:
+        if account_id not in accounts_by_id:
+            raise ValueError(f'No credentials for account {account_id}. Please use --account option.')
+
+    return accounts_by_id
@@ -1,18 +1,19 @@
 from typing import List
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import service_helper
 from src.model.filter import Filter
 
 
-def list_resources(service: BaseAwsService, filters: List[Filter]) -> None:
+def list_resources(services: List[BaseAwsService], filters: List[Filter], fan_out: int) -> None:
     """
     List the resources.
 
-    :param service: Service to list resources for.
+    :param services: Services to list resources for, one per service, account and region.
     :param filters: Filters to apply.
+    :param fan_out: Maximum number of services to list at the same time.
     """
-    resources = service.list_resources(filters)
+    resources = service_helper.list_resources(services, filters, fan_out)
 
-    for resource in resources:
-        text = f"{resource.name} ({resource.description})" if resource.description else resource.name
-        print(text)
+    for service, resource in resources:
+        print(service_helper.get_resource_text(service, resource, services))
@@ -0,0 +1,61 @@
+from src.core.journal.tag_journal import TagJournal
+from src.core.progress.progress_reporter import ProgressReporter
+from src.factory.service_factory import ServiceFactory
+from src.helper import file_helper, input_helper, concurrency_helper
+
+
+def resume_tags(journal_path: str, fan_out: int) -> None:
+    """
+    Resume an interrupted tag or import run from its journal.
+    Only the planned resources that are not done yet are tagged, without listing the resources again. The progress is
+    appended to the same journal, so the run can be resumed again.
+
+    :param journal_path: Path of the journal file of the interrupted run.
+    :param fan_out: Maximum number of services to tag at the same time.
+    """
+    file_helper.validate_file_exists(journal_path)
+
+    pending = TagJournal.read_pending(journal_path)
+    resource_count = sum(len(resource_tags_list) for resource_tags_list in pending.values())
+
+    if not resource_count:
+        print("All resources in the journal are already tagged.")
+        return
+
+    service_resource_tags = {
+        ServiceFactory().get_service(service_name, region_name, account): resource_tags_list
+        for (service_name, region_name, account), resource_tags_list in pending.items()
+    }
+
+    print("The following resources are not tagged yet.")
+
+    for service, resource_tags_list in service_resource_tags.items():
+        print(f'- {service.nice_name} ({service.scope}): {len(resource_tags_list)} resources')
+
+    print('\n')
+    answer = input_helper.get_user_input()
+
+    if answer == 'y':
+        journal = TagJournal(journal_path)
+        progress = ProgressReporter(resource_count)
+
+        try:
+            failed_resources = concurrency_helper.ordered_map(
+                lambda item: item[0].apply_tags(item[1], progress, journal),
+                list(service_resource_tags.items()),
+                fan_out
+            )
+            failed_count = sum(len(resources) for resources in failed_resources)
+        finally:
+            journal.close()
+
+        progress.finish()
+        print(f"\nCompleted tagging {progress.succeeded} resources.")
+
+        if progress.skipped:
+            print(f"Skipped {progress.skipped} resources that already have the tags.")
+
+        if failed_count:
+            print(f"Failed to tag {failed_count} resources. Use --resume {journal_path} to retry them.")
+    else:
+        print("\nTagging cancelled.")
@@ -1,44 +1,80 @@
 from typing import List
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import input_helper
+from src.core.journal.tag_journal import TagJournal
+from src.core.progress.progress_reporter import ProgressReporter
+from src.helper import input_helper, service_helper, concurrency_helper
 from src.model.filter import Filter
+from src.model.resource_tags import ResourceTags
 from src.model.tag import Tag
 
 
-def tag_resources(service: BaseAwsService, filters: List[Filter], tags: List[Tag]) -> None:
+def tag_resources(services: List[BaseAwsService], filters: List[Filter], tags: List[Tag], fan_out: int,
+                  journal_path: str = '') -> None:
     """
     Tag the resources.
+    The resources to be tagged and the ones that are done are recorded in a journal, to resume an interrupted run.
 
-    :param service: Service to tag resources for.
+    :param services: Services to tag resources for, one per service, account and region.
     :param filters: Filters to apply to find resources to be tagged.
     :param tags: Tags to apply to resources.
+    :param fan_out: Maximum number of services to list and tag at the same time.
+    :param journal_path: Path of the journal file, or empty for a new file in the default directory.
     """
     if not tags:
         print("No tags were provided. Please use --tag option.")
         return
 
-    resources = service.list_resources(filters)
-
-    if not resources:
-        print(f"No resources were found for {service.nice_name}.")
-        return
-
     print("The following tags will be applied.")
 
     for tag in tags:
         print(f'- {tag}')
 
-    print(f"\nThe following {service.nice_name} resources will be tagged.")
+    nice_names = service_helper.get_nice_names(services)
+    print(f"\nThe following {nice_names} resources will be tagged.")
+
+    service_resources = {service: [] for service in services}
 
-    for resource in resources:
-        print(f'- {resource.name}')
+    for service, resource in service_helper.list_resources(services, filters, fan_out):
+        print(f'- {service_helper.get_resource_text(service, resource, services)}')
+        service_resources[service].append(resource)
+
+    resource_count = sum(len(resources) for resources in service_resources.values())
+
+    if not resource_count:
+        print(f"No resources were found for {nice_names}.")
+        return
 
     print('\n')
     answer = input_helper.get_user_input()
 
     if answer == 'y':
-        service.tag_resources(resources, tags)
-        print(f"\nCompleted tagging {len(resources)} resources.")
+        journal = TagJournal.create('tag', journal_path)
+        print(f"\nRecording the progress in {journal.path}. Use --resume {journal.path} to resume if interrupted.\n")
+
+        for service, resources in service_resources.items():
+            journal.add_planned(service.key, [ResourceTags(resource, tags) for resource in resources])
+
+        journal.sync()
+        progress = ProgressReporter(resource_count)
+
+        try:
+            failed_resources = concurrency_helper.ordered_map(
+                lambda item: item[0].tag_resources(item[1], tags, progress, journal),
+                [(service, resources) for service, resources in service_resources.items() if resources],
+                fan_out
+            )
+            failed_count = sum(len(resources) for resources in failed_resources)
+        finally:
+            journal.close()
+
+        progress.finish()
+        print(f"\nCompleted tagging {progress.succeeded} resources.")
+
+        if progress.skipped:
+            print(f"Skipped {progress.skipped} resources that already have the tags.")
+
+        if failed_count:
+            print(f"Failed to tag {failed_count} resources.")
     else:
         print("\nTagging cancelled.")
@@ -1,38 +1,38 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
 
 
 class ApiGateway(BaseAwsService):
+    resolves_names_by_listing = True
+
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='Api Gateway',
+            short_name='agw',
+            arn_template='arn:{partition}:apigateway:{region}::/restapis/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('apigateway', region_name=self.region_name)
 
-    def __init__(self):
-        super().__init__(nice_name='Api Gateway', short_name='agw')
-        self.client = boto3.client('apigateway')
-        self.all_resources = self._list_resources(filters=[])
-
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 500
-        response = self.client.get_rest_apis(limit=limit)
-        resources = self.__list_response_to_resources(response)
-        position = response['position'] if 'position' in response else None
+        pages = pagination_helper.paginate(self.client, 'get_rest_apis', self.options.prefetch)
 
-        while position:
-            response = self.client.get_rest_apis(limit=limit, position=position)
-            resources += self.__list_response_to_resources(response)
-            position = response['position'] if 'position' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     def __list_response_to_resources(self, response) -> List[Resource]:
         """
@@ -44,7 +44,7 @@ class ApiGateway(BaseAwsService):
         resources = [
             Resource(
                 name=item['name'],
-                arn=self.get_resource_arn(item['id']),
+                arn=self._get_resource_arn(item['id']),
                 tags=[
                     Tag(key=key_value[0], value=key_value[1])
                     for key_value in list(
@@ -57,15 +57,6 @@ class ApiGateway(BaseAwsService):
 
         return resources
 
-    def get_resource_arn(self, rest_api_id: str) -> str:
-        """
-        Get the ARN for a resource.
-
-        :param rest_api_id: ID of the resource.
-        :return: ARN of the resource.
-        """
-        return f"arn:aws:apigateway:{self.client.meta.region_name}::/restapis/{rest_api_id}"
-
     def get_resource(self, resource_name: str) -> Resource:
         """
         Get a single resource.
@@ -73,13 +64,7 @@ class ApiGateway(BaseAwsService):
         :param resource_name: Name of the resource.
         :return: Resource.
         """
-        response = self.all_resources
-        resource = next((item for item in response if item.name == resource_name), None)
-
-        if resource:
-            return resource
-        else:
-            raise Exception(f"Resource '{resource_name}' not found")
+        return self._get_resource_from_index(resource_name)
 
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
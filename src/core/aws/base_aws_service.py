@@ -1,26 +1,123 @@
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import islice
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
 
+import boto3 as boto3
+
+from src.core.aws.resource_groups_tagging import ResourceGroupsTagging
+from src.core.cache.inventory_cache import InventoryCache
+from src.core.journal.tag_journal import ServiceKey, TagJournal
+from src.core.progress.progress_reporter import ProgressReporter
+from src.core.throttling.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.helper import concurrency_helper, filter_helper, caller_context_helper, vectorized_filter_helper, retry_helper
+from src.model.caller_context import CallerContext
 from src.model.filter import Filter
+from src.model.options import Options
 from src.model.resource import Resource
+from src.model.resource_tags import ResourceTags
 from src.model.tag import Tag
 
+R = TypeVar('R')
+
 
 class BaseAwsService(ABC):
+    # Services that resolve a resource name by listing set this to index all resources by name with a single listing,
+    # when resolving many names at once.
+    resolves_names_by_listing = False
+    # Minimum number of names to resolve at once to use the index. Listing all resources takes a call per page, so it
+    # only pays off for more names than a few pages of resources hold.
+    name_index_threshold = 100
+    # Maximum number of resources the service can tag with a single call. Services with a batch tagging API set this
+    # and override _tag_resource_batch.
+    tag_batch_size = 1
+    # Maximum number of resources the Resource Groups Tagging API can tag with a single call.
+    tagging_api_batch_size = 20
 
-    def __init__(self, nice_name: str, short_name: str):
+    def __init__(self, nice_name: str, short_name: str, tagging_api_resource_type: Optional[str] = None,
+                 arn_template: Optional[str] = None, session: Optional[boto3.Session] = None,
+                 region_name: Optional[str] = None):
         self.nice_name = nice_name
         self.short_name = short_name
+        self.tagging_api_resource_type = tagging_api_resource_type
+        self.arn_template = arn_template
+        self.session = session if session else boto3.Session()
+        self.region_name = region_name
+        # Profile name or ARN of the role the session is created for, or None for the default credentials.
+        self.account: Optional[str] = None
+        self.options = Options()
+        self.__tagging_api = None
+        self.__tagging_api_lock = Lock()
+        self.__inventory_cache = None
+        self.__circuit_breaker = CircuitBreaker()
+        self.__resources_by_name: Optional[Dict[str, Resource]] = None
+        # Names of the resources whose tags were read from the inventory cache, which may be outdated.
+        self.__cached_tag_names: Set[str] = set()
+
+    @property
+    def region(self) -> str:
+        """
+        Get the region the service operates in.
+
+        :return: Region name.
+        """
+        return self.client.meta.region_name
+
+    @property
+    def scope(self) -> str:
+        """
+        Get the account and region the service operates in, to tell apart the resources of the same service in many
+        accounts and regions.
+
+        :return: Account ID and region name.
+        """
+        return f"{self.caller_context.account_id}/{self.region}"
+
+    @property
+    def local_scope(self) -> str:
+        """
+        Get the account and region the service operates in, without calling AWS API, to report errors even if the
+        credentials of the account do not work.
 
-    def list_resources(self, filters: List[Filter]) -> List[Resource]:
+        :return: Account as given, or 'default' for the default credentials, and region name.
+        """
+        return f"{self.account or 'default'}/{self.region}"
+
+    @property
+    def key(self) -> ServiceKey:
+        """
+        Get the service name, region name and account the service was requested with from the service factory.
+
+        :return: Service key.
+        """
+        return self.short_name, self.region_name, self.account
+
+    @property
+    def caller_context(self) -> CallerContext:
+        """
+        Get the account, region and partition the service operates in, to build resource ARNs locally.
+
+        :return: Caller context.
+        """
+        return caller_context_helper.get_caller_context(self.session, self.region)
+
+    def list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List all resources that match the given filters.
+        Resources are streamed, so the first matching resource is available before all pages are listed.
+        If the inventory cache is enabled, the resources and their tags are read through the cache instead.
 
         :param filters: List of filters to apply to the resources.
-        :return: List of resources that match the filters.
+        :return: Iterator of resources that match the filters.
         """
-        tag_filters = [filter for filter in filters if filter.key != '@name']
-        resources = self._list_resources(tag_filters)
+        if self.__uses_inventory_cache():
+            resources = self.__list_resources_through_cache()
+        else:
+            resources = self._list_resources(filters)
+
+            if self.options.tagging_api and self.tagging_api_resource_type:
+                resources = self.__load_tags_from_tagging_api(resources, filters)
+
         filtered_resources = self.__filter_resources(resources, filters)
 
         return filtered_resources
@@ -28,35 +125,221 @@ class BaseAwsService(ABC):
     def get_resource(self, resource_name: str) -> Resource:
         """
         Get a single resource.
+        The ARN is built locally from the ARN template of the service, if any, without calling AWS API.
+
+        :param resource_name: Name of the resource.
+        :return: Resource.
+        """
+        return Resource(name=resource_name, arn=self._get_resource_arn(resource_name))
+
+    def get_resources(self, resource_names: List[str]) -> List[Resource]:
+        """
+        Get multiple resources.
+        Services that resolve names by listing index all resources with a single listing instead, if there are enough
+        names to make it cheaper than resolving each name.
+
+        :param resource_names: Names of the resources.
+        :return: List of resources, in the same order as the given names.
+        """
+        if self.resolves_names_by_listing and len(resource_names) >= self.name_index_threshold:
+            return [self._get_resource_from_index(resource_name) for resource_name in resource_names]
+
+        return [self.get_resource(resource_name) for resource_name in resource_names]
+
+    def _get_resource_from_index(self, resource_name: str) -> Resource:
+        """
+        Get a single resource from the name index of the service.
+        The index is filled by listing all resources once, and reused for the rest of the run.
 
         :param resource_name: Name of the resource.
         :return: Resource.
         """
-        return Resource(name=resource_name)
+        if self.__resources_by_name is None:
+            self.__resources_by_name = {resource.name: resource for resource in self._list_all_resources()}
+
+        if resource_name in self.__resources_by_name:
+            return self.__resources_by_name[resource_name]
+        else:
+            raise Exception(f"Resource '{resource_name}' not found.")
+
+    def _list_all_resources(self) -> Iterator[Resource]:
+        """
+        List all resources of the service, without the defaults that narrow down the listing, to index or cache them.
+
+        :return: Iterator of resources.
+        """
+        return self._list_resources(filters=[])
+
+    def _get_cache_region(self) -> str:
+        """
+        Get the region to key the inventory cache of the service with. Services whose listing covers other regions
+        depending on the given region override this, so the listings of different scopes do not share a cache.
+
+        :return: Region name.
+        """
+        return self.region
+
+    def _get_resource_arn(self, resource_id: str) -> Optional[str]:
+        """
+        Get the ARN for a resource using the ARN template of the service and the caller context.
+
+        :param resource_id: Identifier of the resource in its ARN, usually the resource name.
+        :return: ARN of the resource, or None if the service has no ARN template.
+        """
+        if not self.arn_template:
+            return None
+
+        return self.caller_context.format_arn(self.arn_template, resource_id)
+
+    def _has_live_tags(self, resource: Resource) -> bool:
+        """
+        Check if the tags of the given resource are fetched from AWS in this run, rather than read from the inventory
+        cache, so they can be trusted to decide what to write.
+
+        :param resource: Resource.
+        :return: True, if the tags of the resource are loaded and not read from the inventory cache.
+        """
+        return resource.tags is not None and resource.name not in self.__cached_tag_names
+
+    def _is_in_client_region(self, resource: Resource) -> bool:
+        """
+        Check if the given resource is in the region of the client. Services that list the resources of other regions
+        override this.
+
+        :param resource: Resource.
+        :return: True, if the resource is in the region of the client.
+        """
+        return True
 
     def get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
-        Additionally adds the resource name as a tag with the key '@name'.
+        Tags already loaded for the resource are reused, otherwise they are fetched from the service, retrying transient
+        errors, and kept on the resource. Additionally adds the resource name as a tag with the key '@name'.
 
         :param resource: Resource.
         :return: List of tags for the resource.
         """
-        tags = self._get_resource_tags(resource)
+        if resource.tags is None:
+            resource.tags = self._call_with_retry(lambda: self._get_resource_tags(resource))
+
+        tags = list(resource.tags)
         tags.append(Tag("@name", resource.name))
 
         return tags
 
-    def tag_resources(self, resources: List[Resource], tags: List[Tag]) -> None:
+    def tag_resources(self, resources: List[Resource], tags: List[Tag], progress: Optional[ProgressReporter] = None,
+                      journal: Optional[TagJournal] = None) -> List[Resource]:
         """
         Tag multiple resources with the given tags.
+        Transient errors are retried, and a resource that still fails is reported without stopping the others.
+
+        :param resources: Resources.
+        :param tags: List of tags to apply to the resources.
+        :param progress: Progress reporter shared with other services. If not given, the progress is reported for the
+                         given resources only.
+        :param journal: Journal to record the resources that are done in, if any.
+        :return: List of resources that could not be tagged.
+        """
+        return self.apply_tags([ResourceTags(resource, tags) for resource in resources], progress, journal)
+
+    def apply_tags(self, resource_tags_list: List[ResourceTags], progress: Optional[ProgressReporter] = None,
+                   journal: Optional[TagJournal] = None) -> List[Resource]:
+        """
+        Tag each resource with its own tags.
+        If the current tags of a resource are fetched in this run, only the tags that differ from them are written, and
+        the resource is skipped if all tags already match. Resources with the same tags are grouped, and tagged in
+        batches if the service or the Resource Groups Tagging API supports it. Batches are written concurrently by a
+        bounded pool of workers. Transient errors are retried, and a resource that still fails is reported without
+        stopping the others.
+
+        :param resource_tags_list: List of resources and the tags to apply to them.
+        :param progress: Progress reporter shared with other services. If not given, the progress is reported for the
+                         given resources only.
+        :param journal: Journal to record the resources that are done in, if any.
+        :return: List of resources that could not be tagged.
+        """
+        reporter = progress if progress else ProgressReporter(len(resource_tags_list))
+        changed_resource_tags_list = []
+        batches = []
+
+        for resource_tags in resource_tags_list:
+            changed_tags = self.__get_changed_tags(resource_tags.resource, resource_tags.tags)
+
+            if changed_tags:
+                changed_resource_tags_list.append(ResourceTags(resource_tags.resource, changed_tags))
+            else:
+                reporter.add_skip(resource_tags.resource)
+
+                if journal:
+                    journal.add_done(self.key, resource_tags.resource)
+
+        for tags, resources in self.__group_by_tags(changed_resource_tags_list):
+            tagging_api_resources = [resource for resource in resources if self.__writes_with_tagging_api([resource])]
+            service_resources = [resource for resource in resources if not self.__writes_with_tagging_api([resource])]
+
+            for group, batch_size in [(tagging_api_resources, self.tagging_api_batch_size),
+                                      (service_resources, self.tag_batch_size)]:
+                for start in range(0, len(group), batch_size):
+                    batches.append((tags, group[start:start + batch_size]))
+
+        results = concurrency_helper.ordered_map(
+            lambda batch: (batch, self.__tag_batch(batch[1], batch[0])),
+            batches,
+            self.options.write_concurrency
+        )
+        failed_resources = []
+        written_tags_by_name = {}
+
+        try:
+            for (tags, batch), errors in results:
+                for resource in batch:
+                    if resource.name in errors:
+                        reporter.add_failure(resource, errors[resource.name])
+                        failed_resources.append(resource)
+                    else:
+                        self.__merge_known_tags(resource, tags)
+                        written_tags_by_name.setdefault(resource.name, []).extend(tags)
+                        reporter.add_success(resource)
+
+                        if journal:
+                            journal.add_done(self.key, resource)
+        finally:
+            self.__write_through_tags(written_tags_by_name)
+
+        if not progress:
+            reporter.finish()
+
+        return failed_resources
+
+    def _call_with_retry(self, func: Callable[[], R]) -> R:
+        """
+        Make a service call, retrying transient errors according to the retry policy in the options.
+        Calls are rejected without reaching AWS while the circuit breaker of the service is open.
+
+        :param func: Function that makes the service call.
+        :return: Return value of the function.
+        """
+        return retry_helper.call(
+            func,
+            self.options.retry_policy,
+            self.__circuit_breaker,
+            f"{self.nice_name} in {self.region}"
+        )
+
+    def _tag_resource_batch(self, resources: List[Resource], tags: List[Tag]) -> Dict[str, str]:
+        """
+        Tag a batch of resources with the given tags, at most tag_batch_size resources.
+        Services with a batch tagging API override this, otherwise each resource is tagged with a separate call.
 
         :param resources: Resources.
         :param tags: List of tags to apply to the resources.
+        :return: Dictionary of resource name to error message, for the resources that could not be tagged.
         """
         for resource in resources:
             self.tag_resource(resource, tags)
-            print(f"Tagged resource: {resource.name}")
+
+        return {}
 
     @abstractmethod
     def tag_resource(self, resource: Resource, tags: List[Tag]) -> None:
@@ -69,12 +352,13 @@ class BaseAwsService(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
-        :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :param filters: List of filters to pass to AWS API, if supported. Filters are always applied locally as well,
+                        so services only need to pass the filters their API supports to narrow down the resources.
+        :return: Iterator of resources, yielded page by page.
         """
         raise NotImplementedError()
 
@@ -88,35 +372,323 @@ class BaseAwsService(ABC):
         """
         raise NotImplementedError()
 
-    def __filter_resources(self, resources: List[Resource], filters: List[Filter]) -> List[Resource]:
+    def __list_resources_through_cache(self) -> List[Resource]:
+        """
+        List all resources of the service with their tags, reading through the inventory cache.
+        The cached inventory is used if it is younger than the maximum age, otherwise all resources and their tags are
+        fetched from AWS and stored in the cache. Filters are not pushed to AWS, so the cache holds the whole service.
+
+        In incremental mode, the resources are listed again, but the tags are only fetched for the new resources and
+        a rotating sample of the resources whose tags were fetched the longest time ago. The cached tags are reused for
+        the other resources.
+
+        :return: List of resources, with their tags loaded unless they could not be fetched.
+        """
+        cache = self.__get_inventory_cache()
+
+        if not self.options.refresh and self.options.max_age is not None:
+            age = cache.get_age()
+
+            if age is not None and age <= self.options.max_age:
+                resources = cache.get_resources()
+                self.__cached_tag_names.update(resource.name for resource in resources)
+
+                return resources
+
+        resources = list(self._list_all_resources())
+
+        if self.options.tagging_api and self.tagging_api_resource_type:
+            resources = list(self.__load_tags_from_tagging_api(iter(resources), filters=[]))
+
+        reused_names = self.__reuse_cached_tags(cache, resources) if self.options.incremental else set()
+        self.__cached_tag_names.update(reused_names)
+        resources = list(concurrency_helper.ordered_map(self.__load_resource_tags, resources, self.options.concurrency))
+        cache.put_resources(resources, reused_names=reused_names)
+
+        return resources
+
+    def __reuse_cached_tags(self, cache: InventoryCache, resources: List[Resource]) -> Set[str]:
+        """
+        Set the cached tags on the listed resources whose tags are not loaded yet, except for the stalest ones.
+
+        :param cache: Inventory cache of the service.
+        :param resources: List of listed resources.
+        :return: Names of the resources whose tags were reused from the cache.
+        """
+        cached_tags_by_name = {resource.name: resource.tags for resource in cache.get_resources()}
+        stale_names = set(cache.get_stale_resource_names(self.options.stale_sample))
+        reused_names = set()
+
+        for resource in resources:
+            cached_tags = cached_tags_by_name.get(resource.name)
+
+            if resource.tags is None and cached_tags is not None and resource.name not in stale_names:
+                resource.tags = cached_tags
+                reused_names.add(resource.name)
+
+        return reused_names
+
+    def __get_inventory_cache(self) -> InventoryCache:
+        """
+        Get the inventory cache of the service, for the account and region the service operates in.
+
+        :return: Inventory cache.
+        """
+        if self.__inventory_cache is None:
+            context = self.caller_context
+            self.__inventory_cache = InventoryCache(context.account_id, self._get_cache_region(), self.short_name)
+
+        return self.__inventory_cache
+
+    def __get_changed_tags(self, resource: Resource, tags: List[Tag]) -> List[Tag]:
+        """
+        Get the tags that differ from the current tags of the given resource.
+
+        :param resource: Resource.
+        :param tags: List of tags to apply to the resource.
+        :return: List of tags that are missing or have a different value, or all tags if the current tags are not
+                 fetched from AWS in this run.
+        """
+        if not self._has_live_tags(resource):
+            return tags
+
+        current_tags_dict = {tag.key: tag.value for tag in resource.tags}
+
+        return [tag for tag in tags if current_tags_dict.get(tag.key) != tag.value]
+
+    @staticmethod
+    def __merge_known_tags(resource: Resource, tags: List[Tag]) -> None:
+        """
+        Add the tags applied to the given resource to its current tags, if they are known.
+
+        :param resource: Resource.
+        :param tags: List of tags applied to the resource.
+        """
+        if resource.tags is None:
+            return
+
+        tags_dict = {tag.key: tag.value for tag in resource.tags}
+        tags_dict.update({tag.key: tag.value for tag in tags})
+        resource.tags = [Tag(key, value) for key, value in tags_dict.items()]
+
+    @staticmethod
+    def __group_by_tags(resource_tags_list: List[ResourceTags]) -> List[Tuple[List[Tag], List[Resource]]]:
+        """
+        Group the resources that are tagged with the same set of tags.
+
+        :param resource_tags_list: List of resources and the tags to apply to them.
+        :return: List of tags and the resources to apply them to, in the order the tags are first seen.
+        """
+        groups = {}
+
+        for resource_tags in resource_tags_list:
+            key = frozenset((tag.key, tag.value) for tag in resource_tags.tags)
+            groups.setdefault(key, (resource_tags.tags, []))[1].append(resource_tags.resource)
+
+        return list(groups.values())
+
+    def __writes_with_tagging_api(self, resources: List[Resource]) -> bool:
+        """
+        Check if the given resources are tagged using the Resource Groups Tagging API, which requires their ARNs, and
+        only reaches the resources in the region of its client.
+
+        :param resources: Resources.
+        :return: True, if the Resource Groups Tagging API is used.
+        """
+        return bool(
+            self.options.tagging_api
+            and self.tagging_api_resource_type
+            and self.tag_batch_size < self.tagging_api_batch_size
+            and all(resource.arn and self._is_in_client_region(resource) for resource in resources)
+        )
+
+    def __tag_batch(self, resources: List[Resource], tags: List[Tag]) -> Dict[str, str]:
+        """
+        Tag a batch of resources with the given tags, retrying transient errors.
+        If the whole batch fails with a non-retryable error, it is split in halves and retried, so the failure is
+        attributed to single resources. Transient errors that outlast the retries fail the whole batch, as splitting
+        it would only add load to a degraded endpoint.
+
+        :param resources: Resources.
+        :param tags: List of tags to apply to the resources.
+        :return: Dictionary of resource name to error message, for the resources that could not be tagged.
+        """
+        try:
+            return self._call_with_retry(lambda: self.__write_tags(resources, tags))
+        except Exception as exception:
+            if len(resources) == 1 or isinstance(exception, CircuitOpenError) or retry_helper.is_retryable(exception):
+                return {resource.name: str(exception) for resource in resources}
+
+            middle = len(resources) // 2
+
+            return {**self.__tag_batch(resources[:middle], tags), **self.__tag_batch(resources[middle:], tags)}
+
+    def __write_tags(self, resources: List[Resource], tags: List[Tag]) -> Dict[str, str]:
+        """
+        Tag a batch of resources with the given tags, using the Resource Groups Tagging API if enabled.
+
+        :param resources: Resources.
+        :param tags: List of tags to apply to the resources.
+        :return: Dictionary of resource name to error message, for the resources that could not be tagged.
+        """
+        if not self.__writes_with_tagging_api(resources):
+            return self._tag_resource_batch(resources, tags)
+
+        names_by_arn = {resource.arn: resource.name for resource in resources}
+        errors = self.__get_tagging_api().tag_resources(list(names_by_arn), tags)
+
+        return {names_by_arn[arn]: error for arn, error in errors.items()}
+
+    def __get_tagging_api(self) -> ResourceGroupsTagging:
+        """
+        Get the Resource Groups Tagging API client of the service, creating it on the first request.
+        The first request may come from many worker threads at the same time, so the client is created under a lock.
+
+        :return: Resource Groups Tagging API.
+        """
+        with self.__tagging_api_lock:
+            if self.__tagging_api is None:
+                self.__tagging_api = ResourceGroupsTagging(self.session, self.region)
+
+            return self.__tagging_api
+
+    def __write_through_tags(self, tags_by_name: Dict[str, List[Tag]]) -> None:
+        """
+        Add the tags applied to the given resources to their cached tags in a single transaction, if the inventory cache
+        is in use. Failures are reported, as the tags are already applied and the cache is rebuilt on the next refresh.
+
+        :param tags_by_name: Dictionary of resource name to list of tags applied to the resource.
+        """
+        if not tags_by_name or not self.__uses_inventory_cache():
+            return
+
+        try:
+            self.__get_inventory_cache().merge_resources_tags(tags_by_name)
+        except Exception as exception:
+            print(f"Failed to update the inventory cache of {self.nice_name} in {self.local_scope}: {exception}")
+
+    def __uses_inventory_cache(self) -> bool:
+        """
+        Check if the inventory cache is enabled by the options.
+
+        :return: True, if the resources are read through the inventory cache.
+        """
+        return self.options.refresh or self.options.incremental or self.options.max_age is not None
+
+    def __load_resource_tags(self, resource: Resource) -> Resource:
+        """
+        Load the tags of the given resource from the service, if they are not loaded yet.
+        Failures are reported, and the tags of the resource are left unloaded.
+
+        :param resource: Resource.
+        :return: The same resource.
+        """
+        if resource.tags is None:
+            try:
+                resource.tags = self._call_with_retry(lambda: self._get_resource_tags(resource))
+            except Exception as exception:
+                print(f"Failed to get tags for resource {resource.name}: {exception}")
+
+        return resource
+
+    def __load_tags_from_tagging_api(self, resources: Iterator[Resource], filters: List[Filter]) -> Iterator[Resource]:
+        """
+        Load the tags of the given resources in bulk using the Resource Groups Tagging API.
+        Resources without an ARN, or outside the region of the client, keep their tags unloaded and fall back to the
+        service API, since the Resource Groups Tagging API does not return them.
+
+        :param resources: Iterator of resources.
+        :param filters: List of tag filters to pass to AWS API, if supported.
+        :return: Iterator of resources that may match the filters, with their tags loaded.
+        """
+        tags_by_arn = self.__get_tagging_api().get_tags_by_arn(self.tagging_api_resource_type, filters)
+        server_filtered = bool(filter_helper.get_tagging_api_tag_filters(filters))
+
+        for resource in resources:
+            if not resource.arn or not self._is_in_client_region(resource):
+                yield resource
+            elif resource.arn in tags_by_arn:
+                resource.tags = tags_by_arn[resource.arn]
+                yield resource
+            elif not server_filtered:
+                resource.tags = []
+                yield resource
+
+    def __filter_resources(self, resources: Iterator[Resource], filters: List[Filter]) -> Iterator[Resource]:
         """
         Filter the given resources by their tags using the given filters.
+        Name filters are applied first, so the tags are only fetched for the resources with a matching name.
+        The remaining filters are evaluated in the order of their estimated cost and selectivity.
 
-        :param resources: List of resources.
+        :param resources: Iterator of resources.
         :param filters: List of filters to apply to the resources.
-        :return: List of resources that match the filters.
+        :return: Iterator of resources that match the filters.
         """
-        filtered_resources = []
+        name_filters = [filter for filter in filters if filter.key == '@name']
+        filters = filter_helper.order_filters_by_cost([filter for filter in filters if filter.key != '@name'])
+
+        if name_filters:
+            name_predicates = [filter.compile() for filter in filter_helper.order_filters_by_cost(name_filters)]
+            resources = (resource for resource in resources
+                         if all(predicate({'@name': resource.name}) for predicate in name_predicates))
 
-        maybe_name_filter = [filter for filter in filters if filter.key == '@name']
+        if filters and self.options.vectorized:
+            resources_tags = concurrency_helper.ordered_map(
+                lambda resource: (resource, self.__get_resource_tags_or_none(resource)),
+                resources,
+                self.options.concurrency
+            )
 
-        if maybe_name_filter:
-            name_filter = maybe_name_filter[0]
-            filters.remove(name_filter)
-            resources = [resource for resource in resources
-                         if name_filter.match([Tag(key=name_filter.key, value=resource.name)])]
+            yield from self.__filter_resources_vectorized(resources_tags, filters)
+        elif filters:
+            predicates = [filter.compile() for filter in filters]
+            resources_tags = concurrency_helper.ordered_map(
+                lambda resource: (resource, self.__get_resource_tags_or_none(resource)),
+                resources,
+                self.options.concurrency
+            )
 
-        if filters:
-            for resource in resources:
-                try:
-                    tags = self.get_resource_tags(resource)
-                    all_match = all(filters.match(tags) for filters in filters)
+            for resource, tags in resources_tags:
+                if tags is None:
+                    continue
 
-                    if all_match:
-                        filtered_resources.append(resource)
-                except Exception as exception:
-                    print(f"Failed to get tags for resource {resource.name}: {exception}")
+                tags_dict = {tag.key: tag.value for tag in reversed(tags)}
+                all_match = all(predicate(tags_dict) for predicate in predicates)
+
+                if all_match:
+                    yield resource
         else:
-            filtered_resources = resources
+            yield from resources
 
-        return filtered_resources
+    @staticmethod
+    def __filter_resources_vectorized(resources_tags: Iterator[Tuple[Resource, Optional[List[Tag]]]],
+                                      filters: List[Filter]) -> Iterator[Resource]:
+        """
+        Filter the given resources by their tags, evaluating the filters for a batch of resources at once.
+
+        :param resources_tags: Iterator of resources and their tags, None if the tags could not be fetched.
+        :param filters: List of filters to apply to the resources.
+        :return: Iterator of resources that match the filters.
+        """
+        batch_size = 10000
+        resources_tags = ((resource, tags) for resource, tags in resources_tags if tags is not None)
+        batch = list(islice(resources_tags, batch_size))
+
+        while batch:
+            tags_dicts = [{tag.key: tag.value for tag in reversed(tags)} for _, tags in batch]
+            mask = vectorized_filter_helper.get_matching_mask(tags_dicts, filters)
+            yield from (resource for (resource, _), match in zip(batch, mask) if match)
+            batch = list(islice(resources_tags, batch_size))
+
+    def __get_resource_tags_or_none(self, resource: Resource) -> Optional[List[Tag]]:
+        """
+        Get all tags for the given resource, reporting the failure instead of raising it.
+
+        :param resource: Resource.
+        :return: List of tags for the resource, or None if the tags could not be fetched.
+        """
+        try:
+            return self.get_resource_tags(resource)
+        except Exception as exception:
+            print(f"Failed to get tags for resource {resource.name}: {exception}")
+            return None
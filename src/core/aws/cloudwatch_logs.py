@@ -1,41 +1,52 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import filter_helper
+from src.helper import filter_helper, pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
 
 
 class CloudWatchLogs(BaseAwsService):
+    resolves_names_by_listing = True
+
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='CloudWatch Logs',
+            short_name='logs',
+            tagging_api_resource_type='logs:log-group',
+            arn_template='arn:{partition}:logs:{region}:{account_id}:log-group:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('logs', region_name=self.region_name)
 
-    def __init__(self):
-        super().__init__(nice_name='CloudWatch Logs', short_name='logs')
-        self.client = boto3.client('logs')
-
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 50
         name_prefix = filter_helper.get_name_prefix_filter_value(filters, default='/')
+        pages = pagination_helper.paginate(self.client, 'describe_log_groups', self.options.prefetch,
+                                           logGroupNamePrefix=name_prefix)
 
-        response = self.client.describe_log_groups(limit=limit, logGroupNamePrefix=name_prefix)
-        resources = self.__list_response_to_resources(response)
-        next_token = response['nextToken'] if 'nextToken' in response else None
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
-        while next_token:
-            response = self.client.describe_log_groups(limit=limit, logGroupNamePrefix=name_prefix,
-                                                       nextToken=next_token)
-            resources += self.__list_response_to_resources(response)
-            next_token = response['nextToken'] if 'nextToken' in response else None
+    def _list_all_resources(self) -> Iterator[Resource]:
+        """
+        List all resources of the service, including the log groups whose name does not start with '/'.
 
-        return resources
+        :return: Iterator of resources, yielded page by page.
+        """
+        pages = pagination_helper.paginate(self.client, 'describe_log_groups', self.options.prefetch)
+
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -76,9 +87,10 @@ class CloudWatchLogs(BaseAwsService):
         :return: Resource.
         """
         resources = self._list_resources([Filter(key='@name', operator='^', value=resource_name)])
+        resource = next((resource for resource in resources if resource.name == resource_name), None)
 
-        if resources:
-            return resources[0]
+        if resource:
+            return resource
         else:
             raise Exception(f"Resource '{resource_name}' not found.")
 
@@ -1,8 +1,10 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
+from botocore.exceptions import ClientError
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,28 +12,28 @@ from src.model.tag import Tag
 
 class DynamoDB(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='DynamoDB', short_name='dynamodb')
-        self.client = boto3.client('dynamodb')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='DynamoDB',
+            short_name='dynamodb',
+            tagging_api_resource_type='dynamodb:table',
+            arn_template='arn:{partition}:dynamodb:{region}:{account_id}:table/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('dynamodb', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 100
-        response = self.client.list_tables(Limit=limit)
-        resources = self.__list_response_to_resources(response)
-        last_table = response['LastEvaluatedTableName'] if 'LastEvaluatedTableName' in response else None
+        pages = pagination_helper.paginate(self.client, 'list_tables', self.options.prefetch)
 
-        while last_table:
-            response = self.client.list_tables(Limit=limit, ExclusiveStartTableName=last_table)
-            resources += self.__list_response_to_resources(response)
-            last_table = response['LastEvaluatedTableName'] if 'LastEvaluatedTableName' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     def __list_response_to_resources(self, response) -> List[Resource]:
         """
@@ -43,7 +45,7 @@ class DynamoDB(BaseAwsService):
         resources = [
             Resource(
                 name=table_name,
-                arn=self.client.describe_table(TableName=table_name)['Table']['TableArn'],
+                arn=self.__get_resource_arn(table_name),
             )
             for table_name in response['TableNames']
         ]
@@ -59,11 +61,24 @@ class DynamoDB(BaseAwsService):
         """
         resource = Resource(
             name=resource_name,
-            arn=self.client.describe_table(TableName=resource_name)['Table']['TableArn'],
+            arn=self.__get_resource_arn(resource_name),
         )
 
         return resource
 
+    def __get_resource_arn(self, table_name: str) -> str:
+        """
+        Get the ARN for a resource.
+        The ARN is built locally from the caller context, and only described if the context cannot be resolved.
+
+        :param table_name: Name of the table.
+        :return: ARN of the resource.
+        """
+        try:
+            return self._get_resource_arn(table_name)
+        except ClientError:
+            return self.client.describe_table(TableName=table_name)['Table']['TableArn']
+
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
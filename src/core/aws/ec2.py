@@ -1,43 +1,41 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import filter_helper, pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
 
 
 class EC2(BaseAwsService):
+    tag_batch_size = 1000
+
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='EC2',
+            short_name='ec2',
+            arn_template='arn:{partition}:ec2:{region}:{account_id}:instance/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('ec2', region_name=self.region_name)
 
-    def __init__(self):
-        super().__init__(nice_name='EC2', short_name='ec2')
-        self.client = boto3.client('ec2')
-
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 1000
-        tag_filters = [
-            {'Name': f'tag:{filter.key}', 'Values': [filter.value]}
-            for filter in filters if filter.operator == '='
-        ]
+        tag_filters = filter_helper.get_ec2_filters(filters, name_filter_key='instance-id')
         ec2_filters = tag_filters + [{'Name': 'instance-state-name', 'Values': ['running']}]
+        pages = pagination_helper.paginate(self.client, 'describe_instances', self.options.prefetch,
+                                           Filters=ec2_filters)
 
-        response = self.client.describe_instances(MaxResults=limit, Filters=ec2_filters)
-        resources = self.__list_response_to_resources(response)
-        next_token = response['NextToken'] if 'NextToken' in response else None
-
-        while next_token:
-            response = self.client.describe_instances(MaxResults=limit, Filters=ec2_filters, NextToken=next_token)
-            resources += self.__list_response_to_resources(response)
-            next_token = response['NextToken'] if 'NextToken' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -86,9 +84,21 @@ class EC2(BaseAwsService):
         :param resource: Resource.
         :param tags: List of tags to apply to the resource.
         """
-        instance = boto3.resource('ec2').Instance(resource.name)
+        self._tag_resource_batch([resource], tags)
+
+    def _tag_resource_batch(self, resources: List[Resource], tags: List[Tag]) -> Dict[str, str]:
+        """
+        Tag a batch of resources with the given tags in a single call.
+
+        :param resources: Resources.
+        :param tags: List of tags to apply to the resources.
+        :return: Dictionary of resource name to error message, always empty as the call fails as a whole.
+        """
         tags = [{'Key': tag.key, 'Value': tag.value} for tag in tags]
 
-        instance.create_tags(
+        self.client.create_tags(
+            Resources=[resource.name for resource in resources],
             Tags=tags
         )
+
+        return {}
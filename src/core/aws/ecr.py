@@ -1,9 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import filter_helper
+from src.helper import filter_helper, pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -11,37 +11,40 @@ from src.model.tag import Tag
 
 class ECR(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='ECR', short_name='ecr')
-        self.client = boto3.client('ecr')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='ECR',
+            short_name='ecr',
+            tagging_api_resource_type='ecr:repository',
+            arn_template='arn:{partition}:ecr:{region}:{account_id}:repository/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('ecr', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
         name_filter = filter_helper.get_exact_name_filter_value(filters)
 
-        kwargs = {
-            'maxResults': 1000,
-        }
-
         if name_filter:
-            kwargs['repositoryNames'] = [name_filter] if name_filter else []
+            # Page size cannot be used together with repository names, and a single name fits in a single page.
+            try:
+                response = self.client.describe_repositories(repositoryNames=[name_filter])
+                yield from self.__list_response_to_resources(response)
+            except self.client.exceptions.RepositoryNotFoundException:
+                pass
 
-        response = self.client.describe_repositories(**kwargs)
-        resources = self.__list_response_to_resources(response)
-        next_token = response['nextToken'] if 'nextToken' in response else None
+            return
 
-        while next_token:
-            kwargs['nextToken'] = next_token
-            response = self.client.describe_repositories(**kwargs)
-            resources += self.__list_response_to_resources(response)
-            next_token = response['nextToken'] if 'nextToken' in response else None
+        pages = pagination_helper.paginate(self.client, 'describe_repositories', self.options.prefetch)
 
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -57,31 +60,6 @@ class ECR(BaseAwsService):
 
         return resources
 
-    def get_resource(self, resource_name: str) -> Resource:
-        """
-        Get a single resource.
-
-        :param resource_name: Name of the resource.
-        :return: Resource.
-        """
-        resource = Resource(
-            name=resource_name,
-            arn=self.__get_resource_arn(resource_name)
-        )
-
-        return resource
-
-    @staticmethod
-    def __get_resource_arn(resource_name: str) -> str:
-        """
-        Get the ARN for a resource.
-
-        :param resource_name: Name of the resource.
-        :return: ARN of the resource.
-        """
-        aws_account_id = boto3.client('sts').get_caller_identity().get('Account')
-        return f"arn:aws:ecr:eu-west-1:{aws_account_id}:repository/{resource_name}"
-
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
@@ -1,40 +1,45 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import filter_helper
+from src.helper import filter_helper, pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
 
 
 class ElastiCache(BaseAwsService):
+    resolves_names_by_listing = True
+
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='ElastiCache',
+            short_name='elasticache',
+            tagging_api_resource_type='elasticache:cluster',
+            arn_template='arn:{partition}:elasticache:{region}:{account_id}:cluster:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('elasticache', region_name=self.region_name)
 
-    def __init__(self):
-        super().__init__(nice_name='ElastiCache', short_name='elasticache')
-        self.client = boto3.client('elasticache')
-
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 100
         name_filter = filter_helper.get_exact_name_filter_value(filters)
+        kwargs = {'CacheClusterId': name_filter} if name_filter else {}
+        pages = pagination_helper.paginate(self.client, 'describe_cache_clusters', self.options.prefetch, **kwargs)
 
-        response = self.client.describe_cache_clusters(MaxRecords=limit, CacheClusterId=name_filter)
-        resources = self.__list_response_to_resources(response)
-        marker = response['Marker'] if 'Marker' in response else None
-
-        while marker:
-            response = self.client.describe_cache_clusters(MaxRecords=limit, CacheClusterId=name_filter, Marker=marker)
-            resources += self.__list_response_to_resources(response)
-            marker = response['Marker'] if 'Marker' in response else None
-
-        return resources
+        try:
+            for response in pages:
+                yield from self.__list_response_to_resources(response)
+        except self.client.exceptions.CacheClusterNotFoundFault:
+            if not name_filter:
+                raise
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -58,9 +63,10 @@ class ElastiCache(BaseAwsService):
         :return: Resource.
         """
         response = self._list_resources([Filter(key='@name', operator='=', value=resource_name)])
+        resource = next(response, None)
 
-        if response:
-            return response[0]
+        if resource:
+            return resource
         else:
             raise Exception(f'Resource {resource_name} not found')
 
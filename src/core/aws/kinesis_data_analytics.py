@@ -1,8 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,29 +11,28 @@ from src.model.tag import Tag
 
 class KinesisDataAnalytics(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='Kinesis Data Analytics', short_name='kda')
-        self.client = boto3.client('kinesisanalytics')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='Kinesis Data Analytics',
+            short_name='kda',
+            tagging_api_resource_type='kinesisanalytics:application',
+            arn_template='arn:{partition}:kinesisanalytics:{region}:{account_id}:application/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('kinesisanalytics', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 50
-        response = self.client.list_applications(Limit=limit)
-        resources = self.__list_response_to_resources(response)
+        pages = pagination_helper.paginate(self.client, 'list_applications', self.options.prefetch)
 
-        while response['HasMoreApplications']:
-            response = self.client.list_applications(Limit=limit, ExclusiveStartApplicationName=resources[-1].name)
-            resources += [
-                Resource(name=app['ApplicationName'], arn=app['ApplicationARN'])
-                for app in response['ApplicationSummaries']
-            ]
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -49,19 +49,6 @@ class KinesisDataAnalytics(BaseAwsService):
 
         return resources
 
-    def get_resource(self, resource_name: str) -> Resource:
-        """
-        Get a single resource.
-
-        :param resource_name: Name of the resource.
-        :return: Resource.
-        """
-        response = self.client.describe_application(ApplicationName=resource_name)
-        arn = response['ApplicationDetail']['ApplicationARN']
-        resource = Resource(name=resource_name, arn=arn)
-
-        return resource
-
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,30 +11,30 @@ from src.model.tag import Tag
 
 class KinesisDataFirehose(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='Kinesis Data Firehose', short_name='kdf')
-        self.client = boto3.client('firehose')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='Kinesis Data Firehose',
+            short_name='kdf',
+            tagging_api_resource_type='firehose:deliverystream',
+            arn_template='arn:{partition}:firehose:{region}:{account_id}:deliverystream/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('firehose', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 1000
-        response = self.client.list_delivery_streams(Limit=limit)
-        resources = self.__list_response_to_resources(response)
+        pages = pagination_helper.paginate(self.client, 'list_delivery_streams', self.options.prefetch)
 
-        while response['HasMoreDeliveryStreams']:
-            response = self.client.list_delivery_streams(Limit=limit,
-                                                         ExclusiveStartDeliveryStreamName=resources[-1].name)
-            resources += self.__list_response_to_resources(response)
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
-    @staticmethod
-    def __list_response_to_resources(response) -> List[Resource]:
+    def __list_response_to_resources(self, response) -> List[Resource]:
         """
         Convert a List API call response to a list of resources.
 
@@ -41,7 +42,8 @@ class KinesisDataFirehose(BaseAwsService):
         :return: List of resources.
         """
         resources = [
-            Resource(name=stream_name) for stream_name in response['DeliveryStreamNames']
+            Resource(name=stream_name, arn=self._get_resource_arn(stream_name))
+            for stream_name in response['DeliveryStreamNames']
         ]
 
         return resources
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,26 +11,28 @@ from src.model.tag import Tag
 
 class KinesisDataStreams(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='Kinesis Data Streams', short_name='kds')
-        self.client = boto3.client('kinesis')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='Kinesis Data Streams',
+            short_name='kds',
+            tagging_api_resource_type='kinesis:stream',
+            arn_template='arn:{partition}:kinesis:{region}:{account_id}:stream/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('kinesis', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 1000
-        response = self.client.list_streams(Limit=limit)
-        resources = self.__list_response_to_resources(response)
+        pages = pagination_helper.paginate(self.client, 'list_streams', self.options.prefetch)
 
-        while response['HasMoreStreams']:
-            response = self.client.list_streams(Limit=limit, ExclusiveStartStreamName=resources[-1].name)
-            resources += self.__list_response_to_resources(response)
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
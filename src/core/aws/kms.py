@@ -1,8 +1,9 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,28 +11,40 @@ from src.model.tag import Tag
 
 class KMS(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='KMS', short_name='kms')
-        self.client = boto3.client('kms')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='KMS',
+            short_name='kms',
+            tagging_api_resource_type='kms:key',
+            arn_template='arn:{partition}:kms:{region}:{account_id}:key/{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('kms', region_name=self.region_name)
+        self.__key_arns_by_alias: Optional[Dict[str, str]] = None
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 1000
-        response = self.client.list_aliases(Limit=limit)
-        resources = self.__list_response_to_resources(response)
-        next_marker = response['Marker'] if 'Marker' in response else None
+        if self.__key_arns_by_alias is not None:
+            for alias_name, key_arn in self.__key_arns_by_alias.items():
+                yield Resource(name=alias_name, arn=key_arn)
 
-        while next_marker:
-            response = self.client.list_aliases(Limit=limit, Marker=next_marker)
-            resources += self.__list_response_to_resources(response)
-            next_marker = response['Marker'] if 'Marker' in response else None
+            return
 
-        return resources
+        key_arns_by_alias = {}
+        pages = pagination_helper.paginate(self.client, 'list_aliases', self.options.prefetch)
+
+        for response in pages:
+            resources = self.__list_response_to_resources(response)
+            key_arns_by_alias.update((resource.name, resource.arn) for resource in resources)
+            yield from resources
+
+        self.__key_arns_by_alias = key_arns_by_alias
 
     def __list_response_to_resources(self, response) -> List[Resource]:
         """
@@ -43,7 +56,7 @@ class KMS(BaseAwsService):
         resources = [
             Resource(
                 name=item['AliasName'].split('alias/')[1],
-                arn=self.client.describe_key(KeyId=item['TargetKeyId'])['KeyMetadata']['Arn']
+                arn=self._get_resource_arn(item['TargetKeyId'])
             )
             for item in response['Aliases'] if 'TargetKeyId' in item
         ]
@@ -57,17 +70,12 @@ class KMS(BaseAwsService):
         :param resource_name: Name of the resource.
         :return: Resource.
         """
-        response = self.client.list_aliases(Limit=1000)
-        aliases = response['Aliases']
-
-        for alias_item in aliases:
-            if alias_item['AliasName'] == f'alias/{resource_name}':
-                resource = Resource(
-                    name=alias_item['AliasName'].split('alias/')[-1],
-                    arn=self.client.describe_key(KeyId=alias_item['TargetKeyId'])['KeyMetadata']['Arn']
-                )
+        if self.__key_arns_by_alias is None:
+            # Listing all aliases once builds the alias index, which is reused for the rest of the run.
+            list(self._list_resources(filters=[]))
 
-                return resource
+        if resource_name in self.__key_arns_by_alias:
+            return Resource(name=resource_name, arn=self.__key_arns_by_alias[resource_name])
 
         raise Exception(f"Alias '{resource_name}' not found.")
 
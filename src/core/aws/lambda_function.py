@@ -1,8 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,29 +11,28 @@ from src.model.tag import Tag
 
 class Lambda(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='Lambda', short_name='lambda')
-        self.client = boto3.client('lambda')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='Lambda',
+            short_name='lambda',
+            tagging_api_resource_type='lambda:function',
+            arn_template='arn:{partition}:lambda:{region}:{account_id}:function:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('lambda', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 50
-
-        response = self.client.list_functions(MaxItems=limit)
-        resources = self.__list_response_to_resources(response)
-        next_marker = response['NextMarker'] if 'NextMarker' in response else None
+        pages = pagination_helper.paginate(self.client, 'list_functions', self.options.prefetch)
 
-        while next_marker:
-            response = self.client.list_functions(MaxItems=limit, Marker=next_marker)
-            resources += self.__list_response_to_resources(response)
-            next_marker = response['NextMarker'] if 'NextMarker' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -48,21 +48,6 @@ class Lambda(BaseAwsService):
 
         return resources
 
-    def get_resource(self, resource_name: str) -> Resource:
-        """
-        Get a single resource.
-
-        :param resource_name: Name of the resource.
-        :return: Resource.
-        """
-        response = self.client.get_function(
-            FunctionName=resource_name
-        )
-
-        function_arn = response['Configuration']['FunctionArn']
-
-        return Resource(name=resource_name, arn=function_arn)
-
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
@@ -1,42 +1,43 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
 
 
 class RDS(BaseAwsService):
+    resolves_names_by_listing = True
+
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='RDS',
+            short_name='rds',
+            arn_template='arn:{partition}:rds:{region}:{account_id}:db:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('rds', region_name=self.region_name)
 
-    def __init__(self):
-        super().__init__(nice_name='RDS', short_name='rds')
-        self.client = boto3.client('rds')
-
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 100
         name_filter = [
             {'Name': 'db-instance-id', 'Values': [filter.value]}
             for filter in filters if filter.key == '@name' and filter.operator == '='
         ]
+        pages = pagination_helper.paginate(self.client, 'describe_db_instances', self.options.prefetch,
+                                           Filters=name_filter)
 
-        response = self.client.describe_db_instances(MaxRecords=limit, Filters=name_filter)
-        resources = self.__list_response_to_resources(response)
-        next_marker = response['Marker'] if 'Marker' in response else None
-
-        while next_marker:
-            response = self.client.describe_db_instances(MaxRecords=limit, Filters=name_filter, Marker=next_marker)
-            resources += self.__list_response_to_resources(response)
-            next_marker = response['Marker'] if 'Marker' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -65,9 +66,10 @@ class RDS(BaseAwsService):
         :return: Resource.
         """
         resources = self._list_resources([Filter(key='@name', operator='=', value=resource_name)])
+        resource = next(resources, None)
 
-        if resources:
-            return resources[0]
+        if resource:
+            return resource
         else:
             raise Exception(f"Resource '{resource_name}' not found.")
 
@@ -0,0 +1,70 @@
+from typing import Dict, List
+
+import boto3 as boto3
+
+from src.helper import filter_helper, pagination_helper, session_helper
+from src.model.filter import Filter
+from src.model.tag import Tag
+
+
+class ResourceGroupsTagging:
+
+    def __init__(self, session: boto3.Session, region_name: str):
+        self.client = session_helper.create_client(session, 'resourcegroupstaggingapi', region_name)
+
+    def get_tags_by_arn(self, resource_type: str, filters: List[Filter]) -> Dict[str, List[Tag]]:
+        """
+        Get the tags of all resources of the given type, keyed by resource ARN.
+        Tag filters that the API supports are applied on the server side. Note that the API only returns resources
+        that have at least one tag, or match the given tag filters.
+
+        :param resource_type: Resource type filter, such as 'lambda:function'.
+        :param filters: List of filters to pass to AWS API, if supported.
+        :return: Dictionary of resource ARN to list of tags.
+        """
+        pages = pagination_helper.paginate(
+            self.client,
+            'get_resources',
+            ResourceTypeFilters=[resource_type],
+            TagFilters=filter_helper.get_tagging_api_tag_filters(filters)
+        )
+        tags_by_arn = {}
+
+        for response in pages:
+            tags_by_arn.update(self.__list_response_to_tags_by_arn(response))
+
+        return tags_by_arn
+
+    @staticmethod
+    def __list_response_to_tags_by_arn(response) -> Dict[str, List[Tag]]:
+        """
+        Convert a GetResources API call response to a dictionary of resource ARN to tags.
+
+        :param response: Response from the GetResources API call.
+        :return: Dictionary of resource ARN to list of tags.
+        """
+        tags_by_arn = {
+            item['ResourceARN']: [Tag(key=tag['Key'], value=tag['Value']) for tag in item['Tags']]
+            for item in response['ResourceTagMappingList']
+        }
+
+        return tags_by_arn
+
+    def tag_resources(self, arns: List[str], tags: List[Tag]) -> Dict[str, str]:
+        """
+        Tag the given resources with the given tags in a single call.
+
+        :param arns: ARNs of the resources, at most 20.
+        :param tags: List of tags to apply to the resources.
+        :return: Dictionary of resource ARN to error message, for the resources that could not be tagged.
+        """
+        response = self.client.tag_resources(
+            ResourceARNList=arns,
+            Tags={tag.key: tag.value for tag in tags}
+        )
+        errors = {
+            arn: f"{failure.get('ErrorCode')}: {failure.get('ErrorMessage')}"
+            for arn, failure in response.get('FailedResourcesMap', {}).items()
+        }
+
+        return errors
@@ -1,9 +1,12 @@
-from typing import List
+from threading import Lock
+from typing import Dict, Iterator, List, Optional
 
 import boto3 as boto3
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper, session_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -11,24 +14,36 @@ from src.model.tag import Tag
 
 class S3(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='S3', short_name='s3')
-        self.client = boto3.client('s3')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='S3',
+            short_name='s3',
+            tagging_api_resource_type='s3',
+            arn_template='arn:{partition}:s3:::{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('s3', region_name=self.region_name)
+        self.__bucket_regions: Dict[str, str] = {}
+        self.__regional_clients: Dict[str, BaseClient] = {}
+        self.__regional_clients_lock = Lock()
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        response = self.client.list_buckets()
-        resources = self.__list_response_to_resources(response)
+        # Buckets are listed globally, so only the buckets of the region are listed when a region is given. The
+        # BucketRegion parameter and field need botocore 1.35.42 or later.
+        kwargs = {'BucketRegion': self.region_name} if self.region_name else {}
+        pages = pagination_helper.paginate(self.client, 'list_buckets', self.options.prefetch, **kwargs)
 
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
-    @staticmethod
-    def __list_response_to_resources(response) -> List[Resource]:
+    def __list_response_to_resources(self, response) -> List[Resource]:
         """
         Convert a List API call response to a list of resources.
 
@@ -36,11 +51,33 @@ class S3(BaseAwsService):
         :return: List of resources.
         """
         resources = [
-            Resource(name=item['Name']) for item in response['Buckets']
+            Resource(name=item['Name'], arn=self._get_resource_arn(item['Name'])) for item in response['Buckets']
         ]
+        self.__bucket_regions.update(
+            {item['Name']: item['BucketRegion'] for item in response['Buckets'] if 'BucketRegion' in item}
+        )
 
         return resources
 
+    def _get_cache_region(self) -> str:
+        """
+        Get the region to key the inventory cache of the service with.
+        Without a region, the buckets of all regions are listed, so they are cached separately from the buckets of the
+        client region.
+
+        :return: Region name, or '*' for all regions.
+        """
+        return self.region_name if self.region_name else '*'
+
+    def _is_in_client_region(self, resource: Resource) -> bool:
+        """
+        Check if the given bucket is in the region of the client, as buckets are listed globally without a region.
+
+        :param resource: Resource.
+        :return: True, if the region of the bucket is known and is the region of the client.
+        """
+        return self.__bucket_regions.get(resource.name) == self.region
+
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
@@ -49,7 +86,7 @@ class S3(BaseAwsService):
         :return: List of tags for the resource.
         """
         try:
-            response = self.client.get_bucket_tagging(Bucket=resource.name)
+            response = self.__get_bucket_client(resource).get_bucket_tagging(Bucket=resource.name)
             tags = response['TagSet']
             tags = [Tag(tag['Key'], tag['Value']) for tag in tags]
         except ClientError as error:
@@ -63,18 +100,53 @@ class S3(BaseAwsService):
     def tag_resource(self, resource: Resource, tags: List[Tag]) -> None:
         """
         Tag a resource with the given tags.
+        S3 replaces the whole tag set of a bucket, so the given tags are merged into the current tags of the bucket.
+        Tags already loaded for the bucket in this run are reused, otherwise they are fetched first.
 
         :param resource: Resource.
         :param tags: List of tags to apply to the resource.
         """
-        current_tags = self._get_resource_tags(resource)
+        current_tags = self.__get_current_tags(resource)
         tag_keys = [tag.key for tag in tags]
         tags = tags + [tag for tag in current_tags if tag.key not in tag_keys]
         tags = [{'Key': tag.key, 'Value': tag.value} for tag in tags]
 
-        self.client.put_bucket_tagging(
+        self.__get_bucket_client(resource).put_bucket_tagging(
             Bucket=resource.name,
             Tagging={
                 'TagSet': tags
             }
         )
+
+    def __get_current_tags(self, resource: Resource) -> List[Tag]:
+        """
+        Get the current tags of the given bucket, reusing the tags fetched in this run.
+        Tags read from the inventory cache may be stale, and writing them back would revert the changes made since, so
+        they are fetched again in that case.
+
+        :param resource: Resource.
+        :return: List of tags for the resource.
+        """
+        if self._has_live_tags(resource):
+            return resource.tags
+
+        return self._get_resource_tags(resource)
+
+    def __get_bucket_client(self, resource: Resource) -> BaseClient:
+        """
+        Get the client for the region of the given bucket, so the calls are not redirected from another region.
+        The client of the service is used for the buckets of its region, and the buckets whose region is unknown.
+
+        :param resource: Resource.
+        :return: Boto3 client.
+        """
+        region_name = self.__bucket_regions.get(resource.name)
+
+        if not region_name or region_name == self.region:
+            return self.client
+
+        with self.__regional_clients_lock:
+            if region_name not in self.__regional_clients:
+                self.__regional_clients[region_name] = session_helper.create_client(self.session, 's3', region_name)
+
+            return self.__regional_clients[region_name]
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
+from src.helper import pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -10,27 +11,28 @@ from src.model.tag import Tag
 
 class SNS(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='SNS', short_name='sns')
-        self.client = boto3.client('sns')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='SNS',
+            short_name='sns',
+            tagging_api_resource_type='sns',
+            arn_template='arn:{partition}:sns:{region}:{account_id}:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('sns', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        response = self.client.list_topics()
-        resources = self.__list_response_to_resources(response)
-        next_token = response['NextToken'] if 'NextToken' in response else None
+        pages = pagination_helper.paginate(self.client, 'list_topics', self.options.prefetch)
 
-        while next_token:
-            response = self.client.list_topics(NextToken=next_token)
-            resources += self.__list_response_to_resources(response)
-            next_token = response['NextToken'] if 'NextToken' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
     @staticmethod
     def __list_response_to_resources(response) -> List[Resource]:
@@ -49,31 +51,6 @@ class SNS(BaseAwsService):
 
         return resources
 
-    def get_resource(self, resource_name: str) -> Resource:
-        """
-        Get a single resource.
-
-        :param resource_name: Name of the resource.
-        :return: Resource.
-        """
-        resource = Resource(
-            name=resource_name,
-            arn=self.__get_resource_arn(resource_name)
-        )
-
-        return resource
-
-    @staticmethod
-    def __get_resource_arn(resource_name: str) -> str:
-        """
-        Get the ARN for a resource.
-
-        :param resource_name: Name of the resource.
-        :return: ARN of the resource.
-        """
-        aws_account_id = boto3.client('sts').get_caller_identity().get('Account')
-        return f"arn:aws:sns:eu-west-1:{aws_account_id}:{resource_name}"
-
     def _get_resource_tags(self, resource: Resource) -> List[Tag]:
         """
         Get all tags for the given resource.
@@ -1,9 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 import boto3 as boto3
 
 from src.core.aws.base_aws_service import BaseAwsService
-from src.helper import filter_helper
+from src.helper import filter_helper, pagination_helper
 from src.model.filter import Filter
 from src.model.resource import Resource
 from src.model.tag import Tag
@@ -11,33 +11,32 @@ from src.model.tag import Tag
 
 class SQS(BaseAwsService):
 
-    def __init__(self):
-        super().__init__(nice_name='SQS', short_name='sqs')
-        self.client = boto3.client('sqs')
+    def __init__(self, session: Optional[boto3.Session] = None, region_name: Optional[str] = None):
+        super().__init__(
+            nice_name='SQS',
+            short_name='sqs',
+            tagging_api_resource_type='sqs',
+            arn_template='arn:{partition}:sqs:{region}:{account_id}:{name}',
+            session=session,
+            region_name=region_name
+        )
+        self.client = self.session.client('sqs', region_name=self.region_name)
 
-    def _list_resources(self, filters: List[Filter]) -> List[Resource]:
+    def _list_resources(self, filters: List[Filter]) -> Iterator[Resource]:
         """
         List resources for the service.
 
         :param filters: List of filters to pass to AWS API, if supported.
-        :return: List of resources.
+        :return: Iterator of resources, yielded page by page.
         """
-        limit = 1000
         name_prefix = filter_helper.get_name_prefix_filter_value(filters)
+        pages = pagination_helper.paginate(self.client, 'list_queues', self.options.prefetch,
+                                           QueueNamePrefix=name_prefix)
 
-        response = self.client.list_queues(MaxResults=limit, QueueNamePrefix=name_prefix)
-        resources = self.__list_response_to_resources(response)
-        next_token = response['NextToken'] if 'NextToken' in response else None
-
-        while next_token:
-            response = self.client.list_queues(MaxResults=limit, QueueNamePrefix=name_prefix, NextToken=next_token)
-            resources += self.__list_response_to_resources(response)
-            next_token = response['NextToken'] if 'NextToken' in response else None
-
-        return resources
+        for response in pages:
+            yield from self.__list_response_to_resources(response)
 
-    @staticmethod
-    def __list_response_to_resources(response) -> List[Resource]:
+    def __list_response_to_resources(self, response) -> List[Resource]:
         """
         Convert a List API call response to a list of resources.
 
@@ -45,7 +44,8 @@ class SQS(BaseAwsService):
         :return: List of resources.
         """
         resources = [
-            Resource(name=item.split('/')[-1]) for item in response['QueueUrls']
+            Resource(name=item.split('/')[-1], arn=self._get_resource_arn(item.split('/')[-1]))
+            for item in response['QueueUrls']
         ]
 
         return resources
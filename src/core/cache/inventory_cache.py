@@ -0,0 +1,186 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from src.model.resource import Resource
+from src.model.tag import Tag
+
+
+class InventoryCache:
+    default_path = str(Path.home() / '.aws-tag' / 'inventory.db')
+    schema_version = 2
+
+    def __init__(self, account_id: str, region: str, service: str, path: str = default_path):
+        self.key = (account_id, region, service)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # The cache of a service may be used from the worker threads that process the services concurrently.
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.__create_schema()
+
+    def get_age(self) -> Optional[float]:
+        """
+        Get the age of the cached inventory.
+
+        :return: Seconds since the inventory was last stored, or None if there is no cached inventory.
+        """
+        snapshot = self.connection.execute(
+            'SELECT created_at FROM snapshots WHERE account_id = ? AND region = ? AND service = ?',
+            self.key
+        ).fetchone()
+
+        return time.time() - snapshot[0] if snapshot is not None else None
+
+    def get_resources(self) -> List[Resource]:
+        """
+        Get the cached resources, with their tags.
+
+        :return: List of resources in listing order.
+        """
+        rows = self.connection.execute(
+            'SELECT name, arn, description, tags FROM resources '
+            'WHERE account_id = ? AND region = ? AND service = ? ORDER BY position',
+            self.key
+        )
+
+        return [self.__row_to_resource(row) for row in rows]
+
+    def get_stale_resource_names(self, limit: int) -> List[str]:
+        """
+        Get the names of the resources whose tags were fetched the longest time ago.
+
+        :param limit: Maximum number of names to return.
+        :return: List of resource names, the stalest first.
+        """
+        rows = self.connection.execute(
+            'SELECT name FROM resources WHERE account_id = ? AND region = ? AND service = ? '
+            'ORDER BY fetched_at, position LIMIT ?',
+            self.key + (limit,)
+        )
+
+        return [name for name, in rows]
+
+    def put_resources(self, resources: List[Resource], reused_names: Set[str] = frozenset()) -> None:
+        """
+        Replace the cached resources with the given resources.
+
+        :param resources: List of resources in listing order, with their tags if loaded.
+        :param reused_names: Names of the resources whose tags were reused from the cache. They keep the time their
+                             tags were fetched, the tags of the other resources are marked as fetched now.
+        """
+        now = time.time()
+        fetched_at_by_name = dict(self.connection.execute(
+            'SELECT name, fetched_at FROM resources WHERE account_id = ? AND region = ? AND service = ?',
+            self.key
+        ))
+        rows = [
+            self.key + (
+                position,
+                resource.name,
+                resource.arn,
+                resource.description,
+                self.__tags_to_json(resource.tags),
+                fetched_at_by_name.get(resource.name, now) if resource.name in reused_names else now
+            )
+            for position, resource in enumerate(resources)
+        ]
+
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM resources WHERE account_id = ? AND region = ? AND service = ?',
+                self.key
+            )
+            self.connection.executemany('INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self.connection.execute('INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)', self.key + (now,))
+
+    def merge_resources_tags(self, tags_by_name: Dict[str, List[Tag]]) -> None:
+        """
+        Add the given tags to the cached tags of the resources in a single transaction, overwriting the values of the
+        existing keys. Resources that are not cached or whose tags are not loaded are left unchanged.
+
+        :param tags_by_name: Dictionary of resource name to list of tags applied to the resource.
+        """
+        fetched_at = time.time()
+
+        with self.connection:
+            for resource_name, tags in tags_by_name.items():
+                row = self.connection.execute(
+                    'SELECT tags FROM resources WHERE account_id = ? AND region = ? AND service = ? AND name = ?',
+                    self.key + (resource_name,)
+                ).fetchone()
+
+                if row is None or row[0] is None:
+                    continue
+
+                values_by_key = dict(json.loads(row[0]))
+                values_by_key.update((tag.key, tag.value) for tag in tags)
+                merged_tags = [Tag(key=key, value=value) for key, value in values_by_key.items()]
+
+                self.connection.execute(
+                    'UPDATE resources SET tags = ?, fetched_at = ? '
+                    'WHERE account_id = ? AND region = ? AND service = ? AND name = ?',
+                    (self.__tags_to_json(merged_tags), fetched_at) + self.key + (resource_name,)
+                )
+
+    def __create_schema(self) -> None:
+        """
+        Create the cache tables. The tables of an older schema version are dropped, as the cache can be rebuilt.
+        """
+        version, = self.connection.execute('PRAGMA user_version').fetchone()
+
+        if version == self.schema_version:
+            return
+
+        self.connection.executescript(
+            f"""
+            DROP TABLE IF EXISTS snapshots;
+            DROP TABLE IF EXISTS resources;
+            CREATE TABLE snapshots (
+                account_id TEXT NOT NULL,
+                region TEXT NOT NULL,
+                service TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (account_id, region, service)
+            );
+            CREATE TABLE resources (
+                account_id TEXT NOT NULL,
+                region TEXT NOT NULL,
+                service TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                arn TEXT,
+                description TEXT,
+                tags TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (account_id, region, service, name)
+            );
+            PRAGMA user_version = {self.schema_version};
+            """
+        )
+
+    @staticmethod
+    def __tags_to_json(tags: Optional[List[Tag]]) -> Optional[str]:
+        """
+        Serialise the given tags.
+
+        :param tags: List of tags, or None if the tags are not loaded.
+        :return: JSON list of tag key and value pairs, or None if the tags are not loaded.
+        """
+        if tags is None:
+            return None
+
+        return json.dumps([[tag.key, tag.value] for tag in tags])
+
+    @staticmethod
+    def __row_to_resource(row) -> Resource:
+        """
+        Convert a cached resource row to a resource.
+
+        :param row: Row of name, ARN, description and tags.
+        :return: Resource.
+        """
+        name, arn, description, tags = row
+        tags = [Tag(key=key, value=value) for key, value in json.loads(tags)] if tags is not None else None
+
+        return Resource(name=name, arn=arn, tags=tags, description=description)
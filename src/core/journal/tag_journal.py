@@ -0,0 +1,186 @@
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from src.model.resource import Resource
+from src.model.resource_tags import ResourceTags
+from src.model.tag import Tag
+
+# Service short name, region name and account of a service, as passed to the service factory.
+ServiceKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class TagJournal:
+    """
+    Append-only journal of the resources planned to be tagged and the ones that are done, one JSON object per line.
+    An interrupted run is resumed from the journal, by tagging only the planned resources that are not done yet.
+    Entries are buffered and flushed periodically, so journaling does not slow down the writes. Entries lost on a crash
+    are at most the last flush interval of done resources, and tagging them again is harmless.
+    """
+    default_directory = str(Path.home() / '.aws-tag' / 'journals')
+    flush_interval = 1.0
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.__file = open(path, 'a', encoding='utf-8', buffering=1 << 16)
+
+        # A partially written last line of an interrupted run must not swallow the first appended entry.
+        if not self.__ends_with_newline(path):
+            self.__file.write('\n')
+
+        self.__flushed_at = time.monotonic()
+        self.__lock = Lock()
+
+    @classmethod
+    def create(cls, operation_name: str, path: Optional[str] = None) -> 'TagJournal':
+        """
+        Create a journal for a new run.
+
+        :param operation_name: Name of the operation, used in the default file name.
+        :param path: Path of the journal file, or None for a new file in the default directory.
+        :return: Journal.
+        """
+        if not path:
+            file_name = f"{operation_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
+            path = str(Path(cls.default_directory) / file_name)
+
+        return cls(path)
+
+    def add_planned(self, service_key: ServiceKey, resource_tags_list: List[ResourceTags]) -> None:
+        """
+        Record the resources of a service that are planned to be tagged, with the tags to apply to them.
+
+        :param service_key: Service name, region name and account of the service.
+        :param resource_tags_list: List of resources and the tags to apply to them.
+        """
+        self.__write([
+            {
+                'event': 'planned',
+                **self.__service_key_to_dict(service_key),
+                'name': resource_tags.resource.name,
+                'arn': resource_tags.resource.arn,
+                'tags': {tag.key: tag.value for tag in resource_tags.tags},
+            }
+            for resource_tags in resource_tags_list
+        ])
+
+    def add_done(self, service_key: ServiceKey, resource: Resource) -> None:
+        """
+        Record a resource of a service that is tagged, or needs no changes.
+
+        :param service_key: Service name, region name and account of the service.
+        :param resource: Resource.
+        """
+        self.__write([{'event': 'done', **self.__service_key_to_dict(service_key), 'name': resource.name}])
+
+    def sync(self) -> None:
+        """
+        Flush the buffered entries and write them to the disk, so they survive a crash.
+        """
+        with self.__lock:
+            if self.__file.closed:
+                return
+
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Write the buffered entries to the disk and close the journal file.
+        """
+        self.sync()
+
+        with self.__lock:
+            self.__file.close()
+
+    @staticmethod
+    def read_pending(path: str) -> Dict[ServiceKey, List[ResourceTags]]:
+        """
+        Read the resources that are planned to be tagged in the given journal, but are not done yet.
+        A partially written last line, left by a crash, is ignored.
+
+        :param path: Path of the journal file.
+        :return: List of resources and the tags to apply to them, per service.
+        """
+        planned = {}
+        done = set()
+
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                key = (entry['service'], entry['region'], entry['account'], entry['name'])
+
+                if entry['event'] == 'planned':
+                    planned[key] = entry
+                    done.discard(key)
+                elif entry['event'] == 'done':
+                    done.add(key)
+
+        pending = defaultdict(list)
+
+        for key, entry in planned.items():
+            if key not in done:
+                resource = Resource(name=entry['name'], arn=entry['arn'])
+                tags = [Tag(tag_key, tag_value) for tag_key, tag_value in entry['tags'].items()]
+                pending[key[:3]].append(ResourceTags(resource, tags))
+
+        return dict(pending)
+
+    def __write(self, entries: List[dict]) -> None:
+        """
+        Append the given entries to the journal, flushing the buffer if the flush interval has passed.
+
+        :param entries: Journal entries.
+        """
+        lines = ''.join(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries)
+
+        with self.__lock:
+            # Workers that are still running after an interrupted run is closed have nothing left to record.
+            if self.__file.closed:
+                return
+
+            self.__file.write(lines)
+            now = time.monotonic()
+
+            if now - self.__flushed_at >= self.flush_interval:
+                self.__file.flush()
+                self.__flushed_at = now
+
+    @staticmethod
+    def __ends_with_newline(path: str) -> bool:
+        """
+        Check if the given file is empty or ends with a newline.
+
+        :param path: Path of the file.
+        :return: True, if the file is empty or ends with a newline.
+        """
+        with open(path, 'rb') as file:
+            if file.seek(0, 2) == 0:
+                return True
+
+            file.seek(-1, 2)
+
+            return file.read(1) == b'\n'
+
+    @staticmethod
+    def __service_key_to_dict(service_key: ServiceKey) -> dict:
+        """
+        Convert a service key to the fields of a journal entry.
+
+        :param service_key: Service name, region name and account of the service.
+        :return: Dictionary of journal entry fields.
+        """
+        service_name, region_name, account = service_key
+
+        return {'service': service_name, 'region': region_name, 'account': account}
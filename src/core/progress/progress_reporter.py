@@ -0,0 +1,101 @@
+import sys
+import time
+from threading import Lock
+from typing import List, Tuple
+
+from src.model.resource import Resource
+
+
+class ProgressReporter:
+    """
+    Aggregated progress of a bulk operation, shared by all workers.
+    Instead of a line per resource, a single progress line with the number of completed, skipped and failed resources,
+    the rate and the estimated remaining time is refreshed periodically.
+    """
+
+    def __init__(self, total: int, action: str = 'Tagged', interval: float = 0.5):
+        self.total = total
+        self.action = action
+        self.interval = interval if sys.stdout.isatty() else 5.0
+        self.succeeded = 0
+        self.skipped = 0
+        self.failures: List[Tuple[Resource, str]] = []
+        self.__started_at = time.monotonic()
+        self.__printed_at = float('-inf')
+        self.__lock = Lock()
+
+    @property
+    def done(self) -> int:
+        """
+        Get the number of completed resources, either succeeded, skipped or failed.
+
+        :return: Number of completed resources.
+        """
+        return self.succeeded + self.skipped + len(self.failures)
+
+    def add_success(self, resource: Resource) -> None:
+        """
+        Record a resource that succeeded.
+
+        :param resource: Resource.
+        """
+        with self.__lock:
+            self.succeeded += 1
+            self.__print(final=False)
+
+    def add_skip(self, resource: Resource) -> None:
+        """
+        Record a resource that was skipped, as it needs no changes.
+
+        :param resource: Resource.
+        """
+        with self.__lock:
+            self.skipped += 1
+            self.__print(final=False)
+
+    def add_failure(self, resource: Resource, error: str) -> None:
+        """
+        Record a resource that failed.
+
+        :param resource: Resource.
+        :param error: Error message.
+        """
+        with self.__lock:
+            self.failures.append((resource, error))
+            self.__print(final=False)
+
+    def finish(self) -> None:
+        """
+        Print the final progress line, followed by the failed resources and their errors.
+        """
+        with self.__lock:
+            self.__print(final=True)
+
+            if self.failures:
+                print("\nFailed resources:")
+
+                for resource, error in self.failures:
+                    print(f"- {resource.name}: {error}")
+
+    def __print(self, final: bool) -> None:
+        """
+        Print the progress line, if the print interval has passed since the last print.
+
+        :param final: If True, print regardless of the interval and end the line.
+        """
+        now = time.monotonic()
+
+        if not final and now - self.__printed_at < self.interval:
+            return
+
+        self.__printed_at = now
+        elapsed = now - self.__started_at
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 else 0.0
+        line = (f"{self.action} {self.done}/{self.total} resources, {self.skipped} unchanged, "
+                f"{len(self.failures)} failed, {rate:.1f}/s, ETA {eta:.0f}s")
+
+        if sys.stdout.isatty():
+            print(f"\r{line}", end='\n' if final else '', flush=True)
+        else:
+            print(line, flush=True)
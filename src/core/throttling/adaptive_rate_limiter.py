@@ -0,0 +1,79 @@
+import time
+from threading import Condition
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket rate limiter for a single API, that also limits the number of calls in flight.
+    The rate and concurrency are adapted to the throttling responses of the API. They are increased additively while
+    the limiter is the bottleneck and calls succeed, and decreased multiplicatively when a call is throttled. Until the
+    first throttling response, the increase is exponential, so the limit of the API is found quickly. The limits are
+    decreased at most once per second, as the calls in flight when the limit is hit are likely throttled together.
+    """
+
+    def __init__(self, initial_rate: float = 10.0, min_rate: float = 0.5, max_concurrency: int = 64,
+                 decrease_factor: float = 0.7):
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.concurrency = float(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.slow_start = True
+        self.__tokens = 1.0
+        self.__in_flight = 0
+        self.__refilled_at = time.monotonic()
+        self.__decreased_at = float('-inf')
+        self.__condition = Condition()
+
+    def acquire(self) -> None:
+        """
+        Wait until a call is allowed by both the rate and the concurrency limits, and take a token for it.
+        """
+        with self.__condition:
+            while True:
+                self.__refill()
+
+                if self.__tokens >= 1 and self.__in_flight < int(self.concurrency):
+                    self.__tokens -= 1
+                    self.__in_flight += 1
+                    return
+
+                timeout = (1 - self.__tokens) / self.rate if self.__tokens < 1 else None
+                self.__condition.wait(timeout)
+
+    def release(self, throttled: bool) -> None:
+        """
+        Mark a call as completed, and adapt the limits to its outcome.
+
+        :param throttled: True, if the call was throttled by the API.
+        """
+        with self.__condition:
+            rate_limited = self.__tokens < 1
+            concurrency_limited = self.__in_flight >= int(self.concurrency)
+            self.__in_flight = max(0, self.__in_flight - 1)
+
+            if throttled:
+                if time.monotonic() - self.__decreased_at >= 1:
+                    self.__decreased_at = time.monotonic()
+                    self.slow_start = False
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                    self.concurrency = max(1.0, self.concurrency * self.decrease_factor)
+                    self.__tokens = min(self.__tokens, 0.0)
+            else:
+                if rate_limited:
+                    self.rate += 1 if self.slow_start else 1 / self.rate
+
+                if concurrency_limited:
+                    increase = 1 if self.slow_start else 1 / self.concurrency
+                    self.concurrency = min(float(self.max_concurrency), self.concurrency + increase)
+
+            self.__condition.notify_all()
+
+    def __refill(self) -> None:
+        """
+        Add the tokens accumulated since the last refill, up to one second worth of calls.
+        """
+        now = time.monotonic()
+        capacity = max(1.0, self.rate)
+        self.__tokens = min(capacity, self.__tokens + (now - self.__refilled_at) * self.rate)
+        self.__refilled_at = now
@@ -0,0 +1,87 @@
+import time
+from threading import Lock
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected, because the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that stops calling a degraded endpoint.
+    After a number of consecutive failures the circuit opens, and calls are rejected without reaching the endpoint.
+    Once the reset timeout passes, a single trial call is allowed. The circuit closes if it succeeds, and opens again
+    otherwise.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.__failures = 0
+        self.__opened_at = None
+        self.__trial_in_flight = False
+        self.__lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Check if the circuit is open, regardless of the reset timeout.
+
+        :return: True, if the circuit is open.
+        """
+        return self.__opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Check if a call is allowed. Once the reset timeout passes, only a single trial call is allowed at a time.
+
+        :return: True, if the call is allowed.
+        """
+        with self.__lock:
+            if self.__opened_at is None:
+                return True
+
+            if self.__trial_in_flight or time.monotonic() - self.__opened_at < self.reset_timeout:
+                return False
+
+            self.__trial_in_flight = True
+
+            return True
+
+    def get_wait_time(self) -> float:
+        """
+        Get the time to wait before a call may be allowed again.
+        While a trial call is in flight, a short polling interval is returned, as its outcome is not known yet.
+
+        :return: Seconds to wait, 0 if the circuit is closed.
+        """
+        with self.__lock:
+            if self.__opened_at is None:
+                return 0.0
+
+            remaining = self.reset_timeout - (time.monotonic() - self.__opened_at)
+
+            return remaining if remaining > 0 else min(1.0, self.reset_timeout)
+
+    def record_success(self) -> None:
+        """
+        Record a successful call, closing the circuit.
+        """
+        with self.__lock:
+            self.__failures = 0
+            self.__opened_at = None
+            self.__trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the circuit if the failure threshold is reached or the trial call failed.
+        """
+        with self.__lock:
+            self.__failures += 1
+
+            if self.__trial_in_flight or self.__failures >= self.failure_threshold:
+                self.__opened_at = time.monotonic()
+
+            self.__trial_in_flight = False
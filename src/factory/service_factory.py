@@ -1,52 +1,111 @@
-from src.core.aws.api_gateway import ApiGateway
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import boto3 as boto3
+
 from src.core.aws.base_aws_service import BaseAwsService
-from src.core.aws.cloudwatch_logs import CloudWatchLogs
-from src.core.aws.dynamodb import DynamoDB
-from src.core.aws.ec2 import EC2
-from src.core.aws.ecr import ECR
-from src.core.aws.elastic_block_store import ElasticBlockStore
-from src.core.aws.elasticache import ElastiCache
-from src.core.aws.kinesis_data_analytics import KinesisDataAnalytics
-from src.core.aws.kinesis_data_firehose import KinesisDataFirehose
-from src.core.aws.kinesis_data_streams import KinesisDataStreams
-from src.core.aws.kms import KMS
-from src.core.aws.lambda_function import Lambda
-from src.core.aws.rds import RDS
-from src.core.aws.s3 import S3
-from src.core.aws.sns import SNS
-from src.core.aws.sqs import SQS
+from src.helper import session_helper, rate_limit_helper
+from src.model.options import Options
 
 
 class ServiceFactory:
-    __services = [
-        KinesisDataStreams(),
-        KinesisDataFirehose(),
-        KinesisDataAnalytics(),
-        ApiGateway(),
-        SQS(),
-        EC2(),
-        S3(),
-        Lambda(),
-        RDS(),
-        KMS(),
-        CloudWatchLogs(),
-        DynamoDB(),
-        ElastiCache(),
-        ElasticBlockStore(),
-        SNS(),
-        ECR(),
-    ]
-
-    services = {service.short_name: service for service in __services}
-
-    def get_service(self, service_name: str) -> BaseAwsService:
-        """
-        Get the service class for the given service name.
+    __service_paths = {
+        'kds': 'src.core.aws.kinesis_data_streams.KinesisDataStreams',
+        'kdf': 'src.core.aws.kinesis_data_firehose.KinesisDataFirehose',
+        'kda': 'src.core.aws.kinesis_data_analytics.KinesisDataAnalytics',
+        'agw': 'src.core.aws.api_gateway.ApiGateway',
+        'sqs': 'src.core.aws.sqs.SQS',
+        'ec2': 'src.core.aws.ec2.EC2',
+        's3': 'src.core.aws.s3.S3',
+        'lambda': 'src.core.aws.lambda_function.Lambda',
+        'rds': 'src.core.aws.rds.RDS',
+        'kms': 'src.core.aws.kms.KMS',
+        'logs': 'src.core.aws.cloudwatch_logs.CloudWatchLogs',
+        'dynamodb': 'src.core.aws.dynamodb.DynamoDB',
+        'elasticache': 'src.core.aws.elasticache.ElastiCache',
+        'ebs': 'src.core.aws.elastic_block_store.ElasticBlockStore',
+        'sns': 'src.core.aws.sns.SNS',
+        'ecr': 'src.core.aws.ecr.ECR',
+    }
+
+    __services: Dict[Tuple[str, Optional[str], Optional[str]], BaseAwsService] = {}
+    __options = Options()
+
+    @classmethod
+    def configure(cls, options: Options) -> None:
+        """
+        Set the options applied to every service, including the ones already created.
+
+        :param options: Options.
+        """
+        cls.__options = options
+
+        for service in cls.__services.values():
+            service.options = options
+
+    @classmethod
+    def register(cls, short_name: str, class_path: str) -> None:
+        """
+        Register a service class under the given short name.
+        The service is not imported or created until it is first requested.
+
+        :param short_name: Service short name.
+        :param class_path: Fully qualified path of the service class.
+        """
+        cls.__service_paths[short_name] = class_path
+        cls.__services = {key: service for key, service in cls.__services.items() if key[0] != short_name}
+
+    @property
+    def service_names(self) -> List[str]:
+        """
+        Get the short names of all registered services.
+
+        :return: List of service short names.
+        """
+        return list(self.__service_paths)
+
+    def get_service(self, service_name: str, region_name: Optional[str] = None,
+                    account: Optional[str] = None) -> BaseAwsService:
+        """
+        Get the service class for the given service name, region and account.
+        The service is created on the first request and reused afterwards. Each region and account has its own service
+        and client, and the services of the same account share a session, so the credentials are resolved once.
 
         :param service_name: Service name.
+        :param region_name: Region name, or None for the default region.
+        :param account: Profile name, ARN of the role to assume, or None for the default credentials.
         :return: Service class.
         """
-        if service_name in self.services:
-            return self.services[service_name]
-        else:
+        if service_name not in self.__service_paths:
             raise ValueError(f'Service not found: {service_name}')
+
+        key = (service_name, region_name, account)
+
+        if key not in self.__services:
+            session = session_helper.get_session(account)
+
+            if self.__options.rate_limit:
+                rate_limit_helper.register(session, account)
+
+            service = self.__create_service(self.__service_paths[service_name], session, region_name)
+            service.account = account
+            service.options = self.__options
+            self.__services[key] = service
+
+        return self.__services[key]
+
+    @staticmethod
+    def __create_service(class_path: str, session: boto3.Session, region_name: Optional[str]) -> BaseAwsService:
+        """
+        Import and create the service class at the given path.
+
+        :param class_path: Fully qualified path of the service class.
+        :param session: Boto3 session to create the client of the service with.
+        :param region_name: Region name, or None for the default region.
+        :return: Service class.
+        """
+        module_path, class_name = class_path.rsplit('.', 1)
+        module = importlib.import_module(module_path)
+        service_class = getattr(module, class_name)
+
+        return service_class(session=session, region_name=region_name)
@@ -1,8 +1,10 @@
 import argparse
 
-from src.helper import filter_helper, operation_helper, tag_helper, file_helper
+from src.helper import filter_helper, operation_helper, tag_helper, file_helper, region_helper, session_helper, service_helper
 from src.factory.service_factory import ServiceFactory
 from src.model.arguments import Arguments
+from src.model.options import Options
+from src.model.retry_policy import RetryPolicy
 
 
 def parse_args() -> Arguments:
@@ -14,18 +16,80 @@ def parse_args() -> Arguments:
     parser = argparse.ArgumentParser()
     parser.add_argument('operation', type=str)
     parser.add_argument('--service', type=str, default='')
+    parser.add_argument('--region', type=str, default='')
+    parser.add_argument('--account', type=str, default='')
     parser.add_argument('--filter', action='append')
     parser.add_argument('--tag', action='append')
     parser.add_argument('--file', type=str, default='')
     parser.add_argument('--export-tag', action='append')
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--write-concurrency', type=int, default=1)
+    parser.add_argument('--tagging-api', action='store_true')
+    parser.add_argument('--prefetch', action='store_true')
+    parser.add_argument('--vectorized', action='store_true')
+    parser.add_argument('--refresh', action='store_true')
+    parser.add_argument('--max-age', type=int, default=None)
+    parser.add_argument('--incremental', action='store_true')
+    parser.add_argument('--stale-sample', type=int, default=100)
+    parser.add_argument('--fan-out', type=int, default=16)
+    parser.add_argument('--no-rate-limit', action='store_true')
+    parser.add_argument('--max-attempts', type=int, default=5)
+    parser.add_argument('--retry-deadline', type=float, default=120.0)
+    parser.add_argument('--journal', type=str, default='')
+    parser.add_argument('--resume', type=str, default='')
     args = parser.parse_args()
 
     filter_params = args.filter if args.filter else []
     tag_params = args.tag if args.tag else []
     export_tags = args.export_tag if args.export_tag else []
 
+    if args.concurrency < 1:
+        raise ValueError(f'Invalid concurrency: {args.concurrency}. Must be at least 1.')
+
+    if args.write_concurrency < 1:
+        raise ValueError(f'Invalid write concurrency: {args.write_concurrency}. Must be at least 1.')
+
+    if args.max_age is not None and args.max_age < 0:
+        raise ValueError(f'Invalid max age: {args.max_age}. Must not be negative.')
+
+    if args.stale_sample < 0:
+        raise ValueError(f'Invalid stale sample: {args.stale_sample}. Must not be negative.')
+
+    if args.fan_out < 1:
+        raise ValueError(f'Invalid fan out: {args.fan_out}. Must be at least 1.')
+
+    if args.max_attempts < 1:
+        raise ValueError(f'Invalid max attempts: {args.max_attempts}. Must be at least 1.')
+
+    if args.retry_deadline <= 0:
+        raise ValueError(f'Invalid retry deadline: {args.retry_deadline}. Must be positive.')
+
+    options = Options(
+        concurrency=args.concurrency,
+        write_concurrency=args.write_concurrency,
+        tagging_api=args.tagging_api,
+        prefetch=args.prefetch,
+        vectorized=args.vectorized,
+        refresh=args.refresh,
+        max_age=args.max_age,
+        incremental=args.incremental,
+        stale_sample=args.stale_sample,
+        fan_out=args.fan_out,
+        rate_limit=not args.no_rate_limit,
+        retry_policy=RetryPolicy(max_attempts=args.max_attempts, deadline=args.retry_deadline)
+    )
+    ServiceFactory.configure(options)
+
     operation = operation_helper.parse_operation(args.operation)
-    service = ServiceFactory().get_service(args.service) if args.service else None
+    accounts = session_helper.parse_accounts(args.account)
+    service_names = service_helper.parse_service_names(args.service)
+    regions = region_helper.parse_regions(args.region) if service_names else []
+    services = [
+        ServiceFactory().get_service(service_name, region, account)
+        for service_name in service_names
+        for account in accounts
+        for region in regions
+    ]
     filters = filter_helper.parse_filters(filter_params)
     tags = tag_helper.parse_tags(tag_params)
     file_path = args.file
@@ -38,9 +102,13 @@ def parse_args() -> Arguments:
 
     return Arguments(
         operation=operation,
-        service=service,
+        services=services,
+        accounts=accounts,
         filters=filters,
         tags=tags,
         file_path=file_path,
-        export_tags=export_tags
+        export_tags=export_tags,
+        journal_path=args.journal,
+        resume_path=args.resume,
+        options=options
     )
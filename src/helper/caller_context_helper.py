@@ -0,0 +1,47 @@
+from functools import lru_cache
+from typing import Tuple
+
+import boto3 as boto3
+
+from src.helper import session_helper
+from src.model.caller_context import CallerContext
+
+
+def get_caller_context(session: boto3.Session, region_name: str) -> CallerContext:
+    """
+    Get the account, region and partition of the caller.
+    The caller identity is resolved with a single STS call per session and reused for the rest of the run.
+
+    :param session: Boto3 session of the caller.
+    :param region_name: Region the caller operates in.
+    :return: Caller context.
+    """
+    account_id, partition = __get_caller_identity(session)
+
+    return CallerContext(account_id=account_id, region=region_name, partition=partition)
+
+
+def get_account_id(session: boto3.Session) -> str:
+    """
+    Get the account ID of the caller.
+
+    :param session: Boto3 session of the caller.
+    :return: Account ID.
+    """
+    account_id, _ = __get_caller_identity(session)
+
+    return account_id
+
+
+@lru_cache(maxsize=None)
+def __get_caller_identity(session: boto3.Session) -> Tuple[str, str]:
+    """
+    Get the account ID and partition of the caller.
+
+    :param session: Boto3 session of the caller.
+    :return: Account ID and partition.
+    """
+    response = session_helper.create_client(session, 'sts').get_caller_identity()
+    partition = response['Arn'].split(':')[1]
+
+    return response['Account'], partition
@@ -0,0 +1,150 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Event
+from typing import Callable, Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Set when the user interrupts the program, so the workers stop starting new work and waiting for retries.
+__stop_event = Event()
+
+
+def request_stop() -> None:
+    """
+    Request all maps and waits to stop, as the program is interrupted.
+    """
+    __stop_event.set()
+
+
+def wait(seconds: float) -> bool:
+    """
+    Wait for the given time, or until a stop is requested.
+
+    :param seconds: Seconds to wait.
+    :return: True, if a stop is requested.
+    """
+    return __stop_event.wait(seconds)
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], concurrency: int) -> Iterator[R]:
+    """
+    Apply the function to each item using a bounded thread pool.
+    Results are yielded in the order of the given items, regardless of the completion order.
+    Items are consumed lazily, so at most a small window of items is in flight at any time.
+    If the program is interrupted, the calls that have not started are cancelled and no more results are yielded.
+
+    :param func: Function to apply to each item.
+    :param items: Items to apply the function to.
+    :param concurrency: Maximum number of concurrent calls. Values below 2 run serially.
+    :return: Iterator of results in item order.
+    """
+    if concurrency < 2:
+        try:
+            for item in items:
+                if __stop_event.is_set():
+                    return
+
+                yield func(item)
+        except KeyboardInterrupt:
+            request_stop()
+            raise
+
+        return
+
+    window = concurrency * 2
+    # The executor is not used as a context manager, since leaving it waits for all submitted calls, even when the
+    # program is interrupted.
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = deque()
+
+    try:
+        for item in items:
+            if __stop_event.is_set():
+                return
+
+            futures.append(executor.submit(func, item))
+
+            if len(futures) >= window:
+                yield futures.popleft().result()
+
+        while futures and not __stop_event.is_set():
+            yield futures.popleft().result()
+    except KeyboardInterrupt:
+        request_stop()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+
+def merge_map(func: Callable[[T], Iterable[R]], items: List[T], concurrency: int) -> Iterator[Tuple[T, R]]:
+    """
+    Apply the function to each item using a bounded thread pool, and merge the iterables it returns into one.
+    Results are yielded as soon as they are produced, so the results of different items interleave.
+    If the program is interrupted, the calls that have not started are cancelled, the running calls stop producing at
+    their next result, and no more results are yielded.
+
+    :param func: Function that returns an iterable of results for an item.
+    :param items: Items to apply the function to.
+    :param concurrency: Maximum number of concurrent calls. Values below 2 run serially.
+    :return: Iterator of items and their results, in completion order.
+    """
+    if concurrency < 2 or len(items) < 2:
+        try:
+            for item in items:
+                for result in func(item):
+                    if __stop_event.is_set():
+                        return
+
+                    yield item, result
+        except KeyboardInterrupt:
+            request_stop()
+            raise
+
+        return
+
+    results = Queue()
+    end = object()
+
+    def produce(item: T) -> None:
+        try:
+            for result in func(item):
+                if __stop_event.is_set():
+                    return
+
+                results.put((item, result))
+        finally:
+            results.put((item, end))
+
+    # The executor is not used as a context manager, since leaving it waits for all submitted calls, even when the
+    # program is interrupted.
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = []
+
+    try:
+        futures = [executor.submit(produce, item) for item in items]
+        remaining = len(futures)
+
+        while remaining and not __stop_event.is_set():
+            item, result = results.get()
+
+            if result is end:
+                remaining -= 1
+            else:
+                yield item, result
+
+        if not __stop_event.is_set():
+            for future in futures:
+                future.result()
+    except KeyboardInterrupt:
+        request_stop()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=False)
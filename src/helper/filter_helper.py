@@ -20,18 +20,43 @@ def parse_filters(filter_params: List[str]) -> List[Filter]:
     return parsed_filters
 
 
+def order_filters_by_cost(filters: List[Filter]) -> List[Filter]:
+    """
+    Order the filters to evaluate the cheapest and most selective ones first, so that evaluation short-circuits early.
+    Equality is the cheapest and rejects the most resources, while negated operators reject the fewest.
+    The original order is kept among the filters with the same operator.
+
+    :param filters: List of filters.
+    :return: Ordered list of filters.
+    """
+    operator_ranks = {
+        '=': 0,
+        '^': 1,
+        '$': 2,
+        '~': 3,
+        '--': 4,
+        '!=': 5,
+        '!^': 6,
+        '!$': 7,
+        '!~': 8,
+    }
+
+    return sorted(filters, key=lambda filter: operator_ranks.get(filter.operator, len(operator_ranks)))
+
+
 def get_name_prefix_filter_value(filters: List[Filter], default: str = '') -> str:
     """
     Get the name prefix filter value from the list of filters.
+    An exact name is also a prefix of the name. If there are multiple candidates, the longest one is the most selective.
 
     :param filters: List of filters.
     :param default: Default value to return if no name prefix filter is found.
     :return: Name prefix filter value.
     """
-    name_prefix_filter_value = next(
-        (filter.value for filter in filters if filter.key == '@name' and filter.operator == '^'),
-        default
-    )
+    name_prefix_filter_values = [
+        filter.value for filter in filters if filter.key == '@name' and filter.operator in ['^', '=']
+    ]
+    name_prefix_filter_value = max(name_prefix_filter_values, key=len, default=default)
 
     return name_prefix_filter_value
 
@@ -52,6 +77,65 @@ def get_exact_name_filter_value(filters: List[Filter], default: str = '') -> str
     return exact_name_filter_value
 
 
+def get_ec2_filters(filters: List[Filter], name_filter_key: str) -> List[dict]:
+    """
+    Get the EC2 API filters from the list of filters.
+    Tag filters with '=', '^', '$' and '~' operators are passed as 'tag:<key>' filters using wildcards. Every other
+    operator, except '--', requires the tag key to exist, so those are passed as 'tag-key' filters. Exact name filters
+    are passed using the given filter name. Values of the same filter name are merged, which the API matches with OR,
+    so the result is a superset of the matching resources and the filters are still applied locally.
+
+    :param filters: List of filters.
+    :param name_filter_key: EC2 filter name for the resource name, such as 'instance-id'.
+    :return: List of filters in the EC2 API format.
+    """
+    ec2_filters = {}
+
+    for filter in filters:
+        if filter.key == '@name':
+            if filter.operator == '=':
+                ec2_filters.setdefault(name_filter_key, []).append(filter.value)
+            continue
+
+        value = __escape_ec2_filter_value(filter.value)
+
+        if filter.operator == '=':
+            ec2_filters.setdefault(f'tag:{filter.key}', []).append(value)
+        elif filter.operator == '^':
+            ec2_filters.setdefault(f'tag:{filter.key}', []).append(f'{value}*')
+        elif filter.operator == '$':
+            ec2_filters.setdefault(f'tag:{filter.key}', []).append(f'*{value}')
+        elif filter.operator == '~':
+            ec2_filters.setdefault(f'tag:{filter.key}', []).append(f'*{value}*')
+        elif filter.operator != '--':
+            ec2_filters.setdefault('tag-key', []).append(filter.key)
+
+    return [{'Name': name, 'Values': values} for name, values in ec2_filters.items()]
+
+
+def get_tagging_api_tag_filters(filters: List[Filter]) -> List[dict]:
+    """
+    Get the tag filters for the Resource Groups Tagging API from the list of filters.
+    Equality filters are passed with their value. Every other operator, except '--', requires the tag key to exist,
+    so those are passed as key existence filters. Filters that cannot be passed are left to be applied locally.
+
+    :param filters: List of filters.
+    :return: List of tag filters in the Resource Groups Tagging API format.
+    """
+    tag_filters = {}
+
+    for filter in filters:
+        if filter.key == '@name' or filter.operator == '--':
+            continue
+
+        if filter.operator == '=':
+            tag_filters[filter.key] = {'Key': filter.key, 'Values': [filter.value]}
+        elif filter.key not in tag_filters:
+            tag_filters[filter.key] = {'Key': filter.key}
+
+    return list(tag_filters.values())
+
+
 def __validate_parse_single_filter(filter_param: str) -> Filter:
     """
     Validate and parse a single filter.
@@ -79,6 +163,16 @@ def __validate_parse_single_filter(filter_param: str) -> Filter:
     return filter
 
 
+def __escape_ec2_filter_value(value: str) -> str:
+    """
+    Escape the wildcard characters of the EC2 API filters in the given value.
+
+    :param value: Filter value.
+    :return: Escaped filter value.
+    """
+    return value.replace('\\', '\\\\').replace('*', '\\*').replace('?', '\\?')
+
+
 def __parse_operator(filter_param: str) -> str:
     """
     Parse the operator from the filter.
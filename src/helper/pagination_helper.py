@@ -0,0 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from botocore.client import BaseClient
+from botocore.paginate import Paginator
+
+# Maximum page size each List API allows, keyed by (service name, operation name).
+__MAX_PAGE_SIZES = {
+    ('apigateway', 'get_rest_apis'): 500,
+    ('dynamodb', 'list_tables'): 100,
+    ('ec2', 'describe_instances'): 1000,
+    ('ec2', 'describe_volumes'): 500,
+    ('ecr', 'describe_repositories'): 1000,
+    ('elasticache', 'describe_cache_clusters'): 100,
+    ('firehose', 'list_delivery_streams'): 10000,
+    ('kinesis', 'list_streams'): 10000,
+    ('kinesisanalytics', 'list_applications'): 50,
+    ('kms', 'list_aliases'): 100,
+    ('lambda', 'list_functions'): 50,
+    ('logs', 'describe_log_groups'): 50,
+    ('rds', 'describe_db_instances'): 100,
+    ('resourcegroupstaggingapi', 'get_resources'): 100,
+    ('s3', 'list_buckets'): 10000,
+    ('sqs', 'list_queues'): 1000,
+}
+
+# Pagination configurations for the List APIs that botocore does not provide a paginator for.
+__PAGINATION_CONFIGS = {
+    ('firehose', 'list_delivery_streams'): {
+        'input_token': 'ExclusiveStartDeliveryStreamName',
+        'output_token': 'DeliveryStreamNames[-1]',
+        'more_results': 'HasMoreDeliveryStreams',
+        'limit_key': 'Limit',
+        'result_key': 'DeliveryStreamNames',
+    },
+    ('kinesisanalytics', 'list_applications'): {
+        'input_token': 'ExclusiveStartApplicationName',
+        'output_token': 'ApplicationSummaries[-1].ApplicationName',
+        'more_results': 'HasMoreApplications',
+        'limit_key': 'Limit',
+        'result_key': 'ApplicationSummaries',
+    },
+}
+
+
+def paginate(client: BaseClient, operation_name: str, prefetch: bool = False, **kwargs) -> Iterator[dict]:
+    """
+    Paginate the given List API call, always requesting the maximum page size the API allows.
+    Operations that cannot be paginated are called once.
+
+    :param client: Boto3 client.
+    :param operation_name: Name of the client method, such as 'list_functions'.
+    :param prefetch: If True, fetch the next page in the background while the current page is being consumed.
+    :param kwargs: Parameters to pass to the List API call.
+    :return: Iterator of response pages.
+    """
+    pages = __get_pages(client, operation_name, **kwargs)
+
+    if prefetch:
+        pages = __prefetch_pages(pages)
+
+    return pages
+
+
+def __get_pages(client: BaseClient, operation_name: str, **kwargs) -> Iterator[dict]:
+    """
+    Get the response pages of the given List API call.
+
+    :param client: Boto3 client.
+    :param operation_name: Name of the client method.
+    :param kwargs: Parameters to pass to the List API call.
+    :return: Iterator of response pages.
+    """
+    key = (client.meta.service_model.service_name, operation_name)
+
+    if client.can_paginate(operation_name):
+        paginator = client.get_paginator(operation_name)
+    elif key in __PAGINATION_CONFIGS:
+        operation_model = client.meta.service_model.operation_model(client.meta.method_to_api_mapping[operation_name])
+        paginator = Paginator(getattr(client, operation_name), __PAGINATION_CONFIGS[key], operation_model)
+    else:
+        yield getattr(client, operation_name)(**kwargs)
+        return
+
+    if key in __MAX_PAGE_SIZES:
+        kwargs['PaginationConfig'] = {'PageSize': __MAX_PAGE_SIZES[key]}
+
+    yield from paginator.paginate(**kwargs)
+
+
+def __prefetch_pages(pages: Iterator[dict]) -> Iterator[dict]:
+    """
+    Fetch the next page in a background thread while the current page is being consumed.
+
+    :param pages: Iterator of response pages.
+    :return: Iterator of response pages.
+    """
+    end = object()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = executor.submit(next, pages, end)
+
+        while True:
+            page = next_page.result()
+
+            if page is end:
+                return
+
+            next_page = executor.submit(next, pages, end)
+            yield page
@@ -0,0 +1,110 @@
+from functools import partial
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import boto3 as boto3
+
+from src.core.throttling.adaptive_rate_limiter import AdaptiveRateLimiter
+
+# Error codes AWS APIs return when a call is throttled.
+THROTTLING_ERROR_CODES = frozenset([
+    'BandwidthLimitExceeded',
+    'EC2ThrottledException',
+    'LimitExceededException',
+    'PriorRequestNotComplete',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'SlowDown',
+    'Throttling',
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'TransactionInProgressException',
+])
+
+# Rate limiters shared by all clients and threads of the process, keyed by (account, region name, service ID, operation
+# name), as AWS applies the limits of an API to each account and region separately.
+__limiters: Dict[Tuple[Optional[str], Optional[str], str, str], AdaptiveRateLimiter] = {}
+__limiters_lock = Lock()
+
+
+def register(session: boto3.Session, account: Optional[str] = None) -> None:
+    """
+    Limit the rate of the calls made by the clients created from the given session afterwards.
+    Every attempt of a call, including retries, takes a token from the rate limiter of its API in the account of the
+    session and the region of the client.
+
+    :param session: Boto3 session.
+    :param account: Profile name or ARN of the role the session is created for, or None for the default credentials.
+    """
+    session.events.register('before-sign', partial(__on_before_sign, account), unique_id='aws-tag-rate-limit-acquire')
+    session.events.register('needs-retry', partial(__on_needs_retry, account),
+                            unique_id='aws-tag-rate-limit-release')
+
+
+def get_limiter(account: Optional[str], region_name: Optional[str], service_id: str,
+                operation_name: str) -> AdaptiveRateLimiter:
+    """
+    Get the rate limiter of the given API in the given account and region, creating it on the first request.
+
+    :param account: Profile name or ARN of the role, or None for the default credentials.
+    :param region_name: Region name of the client.
+    :param service_id: Hyphenized service ID, such as 'lambda'.
+    :param operation_name: Operation name, such as 'ListFunctions'.
+    :return: Rate limiter.
+    """
+    key = (account, region_name, service_id, operation_name)
+
+    with __limiters_lock:
+        if key not in __limiters:
+            __limiters[key] = AdaptiveRateLimiter()
+
+        return __limiters[key]
+
+
+def __on_before_sign(account: Optional[str], event_name: str, request, **kwargs) -> None:
+    """
+    Wait for the rate limiter of the API before a request is signed, so a long wait cannot expire the signature.
+
+    :param account: Account of the session the handler is registered on.
+    :param event_name: Event name, such as 'before-sign.lambda.ListFunctions'.
+    :param request: Request, with the context of the call.
+    """
+    _, service_id, operation_name = event_name.split('.')
+    # The client region is used rather than the signing region, so the release after the response finds the same
+    # rate limiter.
+    region_name = request.context.get('client_region')
+    get_limiter(account, region_name, service_id, operation_name).acquire()
+
+
+def __on_needs_retry(account: Optional[str], event_name: str, response: Optional[tuple] = None,
+                     request_dict: Optional[dict] = None, **kwargs) -> None:
+    """
+    Report the outcome of a request to the rate limiter of the API.
+    Returns nothing, so the retry decision is left to botocore.
+
+    :param account: Account of the session the handler is registered on.
+    :param event_name: Event name, such as 'needs-retry.lambda.ListFunctions'.
+    :param response: Tuple of HTTP response and parsed response, or None if the request failed without a response.
+    :param request_dict: Request dictionary, with the context of the call.
+    """
+    _, service_id, operation_name = event_name.split('.')
+    region_name = request_dict.get('context', {}).get('client_region') if request_dict else None
+    get_limiter(account, region_name, service_id, operation_name).release(throttled=__is_throttled(response))
+
+
+def __is_throttled(response: Optional[tuple]) -> bool:
+    """
+    Check if the given response is a throttling response.
+
+    :param response: Tuple of HTTP response and parsed response, or None.
+    :return: True, if the request was throttled.
+    """
+    if response is None:
+        return False
+
+    http_response, parsed = response
+    error_code = parsed.get('Error', {}).get('Code')
+
+    return http_response.status_code == 429 or error_code in THROTTLING_ERROR_CODES
@@ -0,0 +1,53 @@
+from typing import List, Optional
+
+import boto3 as boto3
+
+
+def parse_regions(region_param: str) -> List[Optional[str]]:
+    """
+    Parse the regions from the command line arguments.
+
+    :param region_param: Comma separated region names, or 'all' for all regions enabled in the account.
+    :return: List of region names. A single None for the default region, if no region is given.
+    """
+    if not region_param:
+        return [None]
+
+    if region_param == 'all':
+        return __get_enabled_regions()
+
+    regions = [region.strip() for region in region_param.split(',') if region.strip()]
+
+    for region in regions:
+        __validate(region)
+
+    return list(dict.fromkeys(regions))
+
+
+def __get_enabled_regions() -> List[str]:
+    """
+    Get the regions enabled in the account of the caller.
+
+    :return: List of region names.
+    """
+    response = boto3.client('ec2').describe_regions()
+    regions = sorted(item['RegionName'] for item in response['Regions'])
+
+    return regions
+
+
+def __validate(region: str) -> None:
+    """
+    Validate the region name.
+
+    :param region: Region name to validate.
+    """
+    session = boto3.Session()
+    available_regions = {
+        available_region
+        for partition in session.get_available_partitions()
+        for available_region in session.get_available_regions('ec2', partition_name=partition)
+    }
+
+    if region not in available_regions:
+        raise ValueError(f'Invalid region: {region}')
@@ -0,0 +1,91 @@
+import random
+import time
+from typing import Callable, TypeVar
+
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+
+from src.core.throttling.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.helper import concurrency_helper
+from src.helper.rate_limit_helper import THROTTLING_ERROR_CODES
+from src.model.retry_policy import RetryPolicy
+
+R = TypeVar('R')
+
+# Error codes of transient server side failures, in addition to the throttling error codes.
+__TRANSIENT_ERROR_CODES = frozenset([
+    'InternalError',
+    'InternalFailure',
+    'InternalServerError',
+    'RequestTimeout',
+    'RequestTimeoutException',
+    'ServiceUnavailable',
+    'ServiceUnavailableException',
+])
+
+
+def call(func: Callable[[], R], policy: RetryPolicy, circuit_breaker: CircuitBreaker, name: str) -> R:
+    """
+    Call the function, retrying retryable errors with exponential backoff and full jitter.
+    Retries stop when the maximum number of attempts is reached, or the next attempt would start after the deadline.
+    Retryable errors are recorded by the circuit breaker. While it is open, calls wait for it to allow a trial call,
+    and are rejected without an attempt if that would be after the deadline. Other errors mean the endpoint answered,
+    so they are recorded as successes. Each attempt is a single boto3 call, which botocore may retry on its own.
+    Waits end early if the program is interrupted, failing the call.
+
+    :param func: Function that makes the service call.
+    :param policy: Retry policy.
+    :param circuit_breaker: Circuit breaker of the service.
+    :param name: Name of the service and scope, to report a rejected call.
+    :return: Return value of the function.
+    """
+    deadline = time.monotonic() + policy.deadline
+    attempt = 0
+
+    while True:
+        while not circuit_breaker.allow():
+            wait_time = circuit_breaker.get_wait_time()
+
+            if time.monotonic() + wait_time >= deadline or concurrency_helper.wait(wait_time):
+                raise CircuitOpenError(f"Circuit breaker is open for {name}, the call was not attempted.")
+
+        attempt += 1
+
+        try:
+            result = func()
+        except Exception as exception:
+            if not is_retryable(exception):
+                circuit_breaker.record_success()
+                raise
+
+            circuit_breaker.record_failure()
+            delay = random.uniform(0, min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1)))
+
+            if attempt >= policy.max_attempts or time.monotonic() + delay >= deadline:
+                raise
+
+            if concurrency_helper.wait(delay):
+                raise
+        else:
+            circuit_breaker.record_success()
+            return result
+
+
+def is_retryable(exception: Exception) -> bool:
+    """
+    Check if the given error is likely transient, so the call may succeed if retried.
+
+    :param exception: Error raised by a service call.
+    :return: True, if the call should be retried.
+    """
+    if isinstance(exception, (ConnectionError, HTTPClientError)):
+        return True
+
+    if isinstance(exception, ClientError):
+        error_code = exception.response.get('Error', {}).get('Code')
+        status_code = exception.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+
+        transient = error_code in THROTTLING_ERROR_CODES or error_code in __TRANSIENT_ERROR_CODES
+
+        return transient or status_code == 429 or status_code >= 500
+
+    return False
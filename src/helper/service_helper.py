@@ -0,0 +1,78 @@
+from typing import Iterator, List, Tuple
+
+from src.core.aws.base_aws_service import BaseAwsService
+from src.factory.service_factory import ServiceFactory
+from src.helper import concurrency_helper
+from src.model.filter import Filter
+from src.model.resource import Resource
+
+
+def parse_service_names(service_param: str) -> List[str]:
+    """
+    Parse the service names from the command line arguments.
+
+    :param service_param: Comma separated service short names, or 'all' for all services.
+    :return: List of service short names.
+    """
+    if service_param == 'all':
+        return ServiceFactory().service_names
+
+    service_names = [service_name.strip() for service_name in service_param.split(',') if service_name.strip()]
+
+    return list(dict.fromkeys(service_names))
+
+
+def list_resources(services: List[BaseAwsService], filters: List[Filter],
+                   fan_out: int) -> Iterator[Tuple[BaseAwsService, Resource]]:
+    """
+    List the resources of many services concurrently, merging them into a single stream.
+    A service that fails to list its resources is reported, and the resources of the other services are still listed.
+
+    :param services: Services to list resources for.
+    :param filters: Filters to apply to the resources.
+    :param fan_out: Maximum number of services to list at the same time.
+    :return: Iterator of services and their resources that match the filters, in the order they are found.
+    """
+    return concurrency_helper.merge_map(lambda service: __list_service_resources(service, filters), services, fan_out)
+
+
+def get_resource_text(service: BaseAwsService, resource: Resource, services: List[BaseAwsService]) -> str:
+    """
+    Get the text to print for the given resource.
+    The service short name and scope are added, if the resources of many services are printed together.
+
+    :param service: Service of the resource.
+    :param resource: Resource.
+    :param services: All services whose resources are printed together.
+    :return: Resource text.
+    """
+    text = f"{resource.name} ({resource.description})" if resource.description else resource.name
+
+    if len(services) > 1:
+        text = f"[{service.short_name} {service.scope}] {text}"
+
+    return text
+
+
+def get_nice_names(services: List[BaseAwsService]) -> str:
+    """
+    Get the nice names of the given services, without repeating the same service in many accounts and regions.
+
+    :param services: Services.
+    :return: Comma separated nice names.
+    """
+    return ', '.join(dict.fromkeys(service.nice_name for service in services))
+
+
+def __list_service_resources(service: BaseAwsService, filters: List[Filter]) -> Iterator[Resource]:
+    """
+    List the resources of a single service, reporting the failure instead of raising it.
+
+    :param service: Service to list resources for.
+    :param filters: Filters to apply to the resources.
+    :return: Iterator of resources that match the filters.
+    """
+    try:
+        yield from service.list_resources(filters)
+    except Exception as exception:
+        print(f"Failed to list {service.nice_name} resources in {service.local_scope}: {exception}")
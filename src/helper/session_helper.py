@@ -0,0 +1,99 @@
+from functools import lru_cache
+from threading import Lock
+from typing import List, Optional
+from weakref import WeakKeyDictionary
+
+import boto3 as boto3
+import botocore.session
+from botocore.client import BaseClient
+from botocore.credentials import RefreshableCredentials
+from botocore.exceptions import ProfileNotFound
+
+# Locks of the sessions that clients are created from, as creating clients from the same session on many threads at
+# the same time is not safe.
+__client_locks: 'WeakKeyDictionary[boto3.Session, Lock]' = WeakKeyDictionary()
+__client_locks_lock = Lock()
+
+
+def parse_accounts(account_param: str) -> List[Optional[str]]:
+    """
+    Parse the accounts from the command line arguments.
+
+    :param account_param: Comma separated profile names or ARNs of the roles to assume.
+    :return: List of accounts. A single None for the default credentials, if no account is given.
+    """
+    accounts = [account.strip() for account in account_param.split(',') if account.strip()]
+
+    return list(dict.fromkeys(accounts)) if accounts else [None]
+
+
+@lru_cache(maxsize=None)
+def get_session(account: Optional[str] = None) -> boto3.Session:
+    """
+    Get the session for the given account.
+    The session is created once per account and reused for the rest of the run, so the credentials are cached.
+
+    :param account: Profile name, ARN of the role to assume, or None for the default credentials.
+    :return: Boto3 session.
+    """
+    if not account:
+        return boto3.Session()
+
+    if account.startswith('arn:'):
+        return __assume_role(account)
+
+    try:
+        return boto3.Session(profile_name=account)
+    except ProfileNotFound:
+        raise ValueError(f'Profile not found: {account}')
+
+
+def create_client(session: boto3.Session, service_name: str, region_name: Optional[str] = None) -> BaseClient:
+    """
+    Create a client from the given session, holding the lock of the session.
+    The created client itself is safe to share between threads.
+
+    :param session: Boto3 session.
+    :param service_name: Name of the service, such as 'sts'.
+    :param region_name: Region name, or None for the default region.
+    :return: Boto3 client.
+    """
+    with __client_locks_lock:
+        if session not in __client_locks:
+            __client_locks[session] = Lock()
+
+        lock = __client_locks[session]
+
+    with lock:
+        return session.client(service_name, region_name=region_name)
+
+
+def __assume_role(role_arn: str) -> boto3.Session:
+    """
+    Create a session with the credentials of the given role.
+    The role is assumed again when the credentials are about to expire.
+
+    :param role_arn: ARN of the role to assume.
+    :return: Boto3 session.
+    """
+    sts_client = boto3.client('sts')
+
+    def get_credentials() -> dict:
+        response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName='aws-tag')
+        credentials = response['Credentials']
+
+        return {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': credentials['Expiration'].isoformat(),
+        }
+
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+        metadata=get_credentials(),
+        refresh_using=get_credentials,
+        method='sts-assume-role'
+    )
+
+    return boto3.Session(botocore_session=botocore_session)
@@ -0,0 +1,73 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.model.filter import Filter
+
+
+def get_matching_mask(tags_dicts: List[Dict[str, str]], filters: List[Filter]) -> np.ndarray:
+    """
+    Evaluate the filters for many resources at once using vectorised operations.
+    The tags are put into a columnar table with one row per resource and one dictionary encoded column per filtered
+    tag key. String operations are applied once per distinct tag value, and the results are mapped back to the rows.
+
+    :param tags_dicts: List of tag key to value dictionaries, one per resource.
+    :param filters: List of filters to apply to the resources.
+    :return: Boolean array, True for the resources that match all filters.
+    """
+    keys = {filter.key for filter in filters}
+    columns = {key: __encode_column([tags_dict.get(key) for tags_dict in tags_dicts]) for key in keys}
+    mask = np.ones(len(tags_dicts), dtype=bool)
+
+    for filter in filters:
+        codes, values = columns[filter.key]
+        # Missing tags have the code -1, which picks the last item of the lookup, that is the result for missing tags.
+        lookup = np.append(__get_values_mask(values, filter), filter.operator == '--')
+        mask &= lookup[codes]
+
+    return mask
+
+
+def __encode_column(column: List[str]) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Dictionary encode a tag column.
+
+    :param column: Tag values, None for the resources without the tag.
+    :return: Code of each row, -1 for missing tags, and the distinct tag values.
+    """
+    codes, values = pd.factorize(np.array(column, dtype=object))
+
+    return codes, pd.Series(values, dtype=object)
+
+
+def __get_values_mask(values: pd.Series, filter: Filter) -> np.ndarray:
+    """
+    Evaluate a single filter on the distinct values of a tag column.
+
+    :param values: Distinct tag values of the filter key.
+    :param filter: Filter to apply.
+    :return: Boolean array, True for the values that match the filter.
+    """
+    if filter.operator == '--':
+        mask = np.zeros(len(values), dtype=bool)
+    elif filter.operator == '=':
+        mask = values == filter.value
+    elif filter.operator == '!=':
+        mask = values != filter.value
+    elif filter.operator == '~':
+        mask = values.str.contains(filter.value, regex=False)
+    elif filter.operator == '!~':
+        mask = ~values.str.contains(filter.value, regex=False)
+    elif filter.operator == '^':
+        mask = values.str.startswith(filter.value)
+    elif filter.operator == '!^':
+        mask = ~values.str.startswith(filter.value)
+    elif filter.operator == '$':
+        mask = values.str.endswith(filter.value)
+    elif filter.operator == '!$':
+        mask = ~values.str.endswith(filter.value)
+    else:
+        raise ValueError(f"Unknown operator: {filter.operator}")
+
+    return np.asarray(mask, dtype=bool)
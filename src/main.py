@@ -1,4 +1,4 @@
-from src.core.app import list_operation, tag_operation, export_operation, import_operation
+from src.core.app import list_operation, tag_operation, export_operation, import_operation, resume_operation
 from src.helper import argument_helper
 from src.model.operation import Operation
 
@@ -10,22 +10,32 @@ def main():
     args = argument_helper.parse_args()
 
     if args.operation == Operation.LIST:
-        assert args.service, 'You must provide a service using --service flag'
-        list_operation.list_resources(args.service, args.filters)
+        assert args.services, 'You must provide a service using --service flag'
+        list_operation.list_resources(args.services, args.filters, args.options.fan_out)
+
+    if args.operation in (Operation.TAG, Operation.IMPORT) and args.resume_path:
+        resume_operation.resume_tags(args.resume_path, args.options.fan_out)
+        return
 
     if args.operation == Operation.TAG:
-        assert args.service, 'You must provide a service using --service flag'
+        assert args.services, 'You must provide a service using --service flag'
         assert args.tags, 'You must provide at least one tag using --tag flag'
-        tag_operation.tag_resources(args.service, args.filters, args.tags)
+        tag_operation.tag_resources(args.services, args.filters, args.tags, args.options.fan_out, args.journal_path)
 
     if args.operation == Operation.EXPORT:
-        assert args.service, 'You must provide a service using --service flag'
+        assert args.services, 'You must provide a service using --service flag'
         assert args.file_path, 'You must provide a file path using --file flag'
-        export_operation.export_tags(args.service, args.filters, args.file_path, args.export_tags)
+        export_operation.export_tags(
+            args.services,
+            args.filters,
+            args.file_path,
+            args.export_tags,
+            args.options.fan_out
+        )
 
     if args.operation == Operation.IMPORT:
         assert args.file_path, 'You must provide a file path using --file flag'
-        import_operation.import_tags(args.file_path)
+        import_operation.import_tags(args.file_path, args.accounts, args.journal_path)
 
 
 if __name__ == '__main__':
@@ -1,17 +1,22 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from src.core.aws.base_aws_service import BaseAwsService
 from src.model.filter import Filter
 from src.model.operation import Operation
+from src.model.options import Options
 from src.model.tag import Tag
 
 
 @dataclass
 class Arguments:
     operation: Operation
-    service: BaseAwsService
+    services: List[BaseAwsService]
+    accounts: List[Optional[str]]
     filters: List[Filter]
     tags: List[Tag]
     file_path: str
     export_tags: List[str]
+    journal_path: str
+    resume_path: str
+    options: Options
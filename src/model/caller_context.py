@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CallerContext:
+    account_id: str
+    region: str
+    partition: str
+
+    def format_arn(self, arn_template: str, resource_id: str) -> str:
+        """
+        Build the ARN of a resource owned by the caller from an ARN template.
+
+        :param arn_template: ARN template with '{partition}', '{region}', '{account_id}' and '{name}' placeholders.
+        :param resource_id: Resource identifier to fill the '{name}' placeholder with.
+        :return: ARN of the resource.
+        """
+        return arn_template.format(
+            partition=self.partition,
+            region=self.region,
+            account_id=self.account_id,
+            name=resource_id
+        )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Dict, List
 
 from src.model.tag import Tag
 
@@ -23,30 +23,37 @@ class Filter:
         :param tags: Tag list.
         :return: True, if the filter matches the given tags.
         """
+        tags_dict = {tag.key: tag.value for tag in reversed(tags)}
+
+        return self.compile()(tags_dict)
+
+    def compile(self) -> Callable[[Dict[str, str]], bool]:
+        """
+        Compile the filter into a predicate over a dictionary of tag keys to values.
+        The operator is resolved once here, so the predicate can be applied to many resources cheaply.
+
+        :return: Predicate that returns True, if the filter matches the given tags dictionary.
+        """
+        key = self.key
+        value = self.value
 
         if self.operator == "--":
-            tag_keys = [tag.key for tag in tags]
-            return self.key not in tag_keys
-
-        for tag in tags:
-            if self.key == tag.key:
-                if self.operator == "=":
-                    return tag.value == self.value
-                elif self.operator == "!=":
-                    return tag.value != self.value
-                elif self.operator == "~":
-                    return self.value in tag.value
-                elif self.operator == "!~":
-                    return self.value not in tag.value
-                elif self.operator == "^":
-                    return tag.value.startswith(self.value)
-                elif self.operator == "!^":
-                    return not tag.value.startswith(self.value)
-                elif self.operator == "$":
-                    return tag.value.endswith(self.value)
-                elif self.operator == "!$":
-                    return not tag.value.endswith(self.value)
-                else:
-                    raise ValueError(f"Unknown operator: {self.operator}")
-
-        return False
+            return lambda tags: key not in tags
+        elif self.operator == "=":
+            return lambda tags: tags.get(key) == value
+        elif self.operator == "!=":
+            return lambda tags: key in tags and tags[key] != value
+        elif self.operator == "~":
+            return lambda tags: key in tags and value in tags[key]
+        elif self.operator == "!~":
+            return lambda tags: key in tags and value not in tags[key]
+        elif self.operator == "^":
+            return lambda tags: key in tags and tags[key].startswith(value)
+        elif self.operator == "!^":
+            return lambda tags: key in tags and not tags[key].startswith(value)
+        elif self.operator == "$":
+            return lambda tags: key in tags and tags[key].endswith(value)
+        elif self.operator == "!$":
+            return lambda tags: key in tags and not tags[key].endswith(value)
+        else:
+            raise ValueError(f"Unknown operator: {self.operator}")
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.model.retry_policy import RetryPolicy
+
+
+@dataclass
+class Options:
+    concurrency: int = 1
+    write_concurrency: int = 1
+    tagging_api: bool = False
+    prefetch: bool = False
+    vectorized: bool = False
+    refresh: bool = False
+    max_age: Optional[int] = None
+    incremental: bool = False
+    stale_sample: int = 100
+    fan_out: int = 16
+    rate_limit: bool = True
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)